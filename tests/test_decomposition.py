@@ -217,6 +217,14 @@ def test_decomposition_rounding(dtype):
     assert T.R == [1, 1, 1, 1], 'Case 3: Ranks not equal'
     assert err_rel(Tfull, T_ref) < 1e-3, 'Case 1: error too high'
 
+    # successive roundings (the orthogonality of the previous result is reused)
+    T = tntt.TT(T_ref).round(1e-9).round(1e-6)
+    assert T.R == [1, 2, 2, 1], 'Case 4: Ranks not equal'
+    assert err_rel(T.full(), T_ref) < 1e-6, 'Case 4: error too high'
+    T = T.round(1e-3)
+    assert T.R == [1, 1, 1, 1], 'Case 5: Ranks not equal'
+    assert err_rel(T.full(), T_ref) < 1e-3, 'Case 5: error too high'
+
 
 @pytest.mark.parametrize("dtype", parameters)
 def test_dimension_permute(dtype):
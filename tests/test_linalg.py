@@ -37,6 +37,15 @@ def test_add(dtype):
 
     assert err_rel(w.full(), W) < 1e-14, 'Addition error 1'
     assert err_rel(t.full(), T) < 1e-14, 'Addition error 2'
+    assert err_rel((x+np.float32(2.5)).full(), X+2.5) < 1e-14, 'Addition error: numpy scalar'
+    assert err_rel((np.float64(2.5)+x).full(), X+2.5) < 1e-14, 'Addition error: numpy scalar'
+
+    # interior cores of equal shape: small (processed together) and large (processed one by one)
+    for N, R in [([4, 5, 5, 4], [1, 3, 3, 3, 1]), ([4, 20, 20, 4], [1, 16, 16, 16, 1])]:
+        x = tntt.random(N, R, dtype=dtype)
+        y = tntt.random(N, R, dtype=dtype)
+        assert err_rel((x+y).full(), x.full()+y.full()) < 1e-14, 'Addition error 3'
+        assert err_rel((x*y).full(), x.full()*y.full()) < 1e-14, 'Elementwise product error: equal interior cores'
 
     M = tntt.random([(5, 6), (7, 8), (9, 10)], [1, 5, 5, 1])
     P = tntt.random([(5, 6), (7, 8), (9, 10)], [1, 2, 20, 1])
@@ -114,6 +123,10 @@ def test_sub(dtype):
     assert err_rel(w.full(), W) < 1e-14, 'Subtraction error 1'
     assert err_rel(t.full(), T) < 1e-14, 'Subtraction error 2'
 
+    c = tn.tensor(const, dtype=dtype)
+    assert err_rel((x-c).full(), X-c) < 1e-14, 'Subtraction error: torch scalar'
+    assert err_rel((x-np.float32(1.0)).full(), X-1.0) < 1e-14, 'Subtraction error: numpy scalar'
+
     M = tntt.random([(5, 6), (7, 8), (9, 10)], [1, 5, 5, 1])
     P = tntt.random([(5, 6), (7, 8), (9, 10)], [1, 2, 20, 1])
 
@@ -204,6 +217,10 @@ def test_mult(dtype):
     assert err_rel(C.full(), Cr) < 1e-13, "Multiplication error: TT-matrix 0 with scalar."
     assert C.R == [1, 1, 1, 1, 1], "Multiplication error: TT-matrix 0 with scalar."
 
+    z = x/c
+    assert err_rel(z.full(), xr/c) < 1e-13, "Division error: TT-tensor with scalar."
+    assert err_rel(x.full(), xr) < 1e-15, "Division error: the operand was modified."
+
     # test broadcasting
 
     x = tntt.random([2, 3, 4, 5, 6], [1, 2, 4, 8, 4, 1],
@@ -274,6 +291,11 @@ def test_matmult(dtype):
     z_ref = tn.einsum('abcijk,ijk->abc', B_ref, x_ref)
     assert err_rel(z.full(), z_ref) < 1e-13, "torchtt.TT.__matmul__() error: TT matrix with TT vector."
 
+    # vector matrix
+    w = y @ B
+    w_ref = tn.einsum('ijk,ijkabc->abc', y_ref, B_ref)
+    assert err_rel(w.full(), w_ref) < 1e-13, "torchtt.TT.__matmul__() error: TT vector with TT matrix."
+
 @pytest.mark.parametrize("dtype", parameters)
 def test_matvecdense(dtype):
     """
@@ -339,6 +361,32 @@ def test_dot(dtype):
     assert err_rel(x, tn.einsum('abcdef,abcdef->', a.full(), tn.conj(b.full()))) < 1e-12, 'Dot product error. Test: equal sized tensors.'
     assert err_rel(y.full(), tn.einsum('abcdef,bdf->ace', a.full(), tn.conj(c.full()))) < 1e-12, 'Dot product error. Test: different sizes 1.'
     assert err_rel(z.full(), tn.einsum('abcdef,abf->cde', b.full(), tn.conj(d.full()))) < 1e-12, 'Dot product error. Test: different sizes 2.'
+    assert err_rel(tntt.dot(a, b, [0, 1, 2, 3, 4, 5]), x) < 1e-12, 'Dot product error. Test: all the modes contracted.'
+
+    e = tntt.random([4, 5, 6], [1, 1, 1, 1], dtype=dtype)
+    f = tntt.random([4, 5, 6], [1, 1, 1, 1], dtype=dtype)
+    assert err_rel(tntt.dot(e, f), tn.einsum('abc,abc->', e.full(), tn.conj(f.full()))) < 1e-12, 'Dot product error. Test: rank 1 tensors.'
+
+    w = tntt.dot(a, b, compute_dtype=tn.complex64 if dtype.is_complex else tn.float32)
+    assert w.dtype == dtype and err_rel(w, tn.einsum('abcdef,abcdef->', a.full(), tn.conj(b.full()))) < 1e-4, 'Dot product error. Test: compute dtype.'
+    # the low precision products are checked relative to the product of the norms (the error bound of the dot product)
+    for compute_dtype in [tn.bfloat16, tn.float16]:
+        if dtype.is_complex:
+            with pytest.raises(tntt.errors.InvalidArguments):
+                tntt.dot(a, b, compute_dtype=compute_dtype)
+        else:
+            w = tntt.dot(a, b, compute_dtype=compute_dtype)
+            assert w.dtype == dtype and tn.abs(w-x) < 1e-2*a.norm()*b.norm(), 'Dot product error. Test: compute dtype ' + str(compute_dtype) + '.'
+
+    assert abs(tntt.dot(a, b, scalar=True) - x.item()) < 1e-12*abs(x.item()), 'Dot product error. Test: scalar result.'
+
+    bs = [tntt.random([4, 5, 6, 7, 8, 9], [1, 3, 4, 10, 10, 4, 1], dtype=dtype) for _ in range(3)]
+    w = tntt.dot_batch(a, bs)
+    assert err_rel(w, tn.stack([tn.einsum('abcdef,abcdef->', a.full(), tn.conj(t.full())) for t in bs])) < 1e-12, 'Dot product error. Test: batched.'
+    with pytest.raises(tntt.errors.InvalidArguments):
+        tntt.dot_batch(a, [])
+    with pytest.raises(tntt.errors.ShapeMismatch):
+        tntt.dot_batch(a, [bs[0], c])
 
 @pytest.mark.parametrize("dtype", parameters)
 def test_sum(dtype):
@@ -351,6 +399,24 @@ def test_sum(dtype):
 
     assert err_rel(a.sum(), afull.sum()) < 1e-13, "Test TT.sum() error 1."
 
+    A = tntt.random([(2, 3), (4, 5), (3, 2)], [1, 3, 4, 1], dtype=dtype)
+    assert err_rel(A.sum(), A.full().sum()) < 1e-13, "Test TT.sum() error 2 (TT-matrix)."
+
+@pytest.mark.parametrize("dtype", parameters)
+def test_norm(dtype):
+    '''
+    Test the norm method (small cores and large cores).
+    '''
+    a = tntt.random([2]*10, [1]+[4]*9+[1], dtype=dtype)
+    b = tntt.random([(3, 4), (20, 30), (2, 2)], [1, 10, 12, 1], dtype=dtype)
+
+    assert err_rel(a.norm(), tn.linalg.norm(a.full())) < 1e-13, "Test TT.norm() error 1."
+    assert err_rel(a.norm(True), tn.linalg.norm(a.full())**2) < 1e-13, "Test TT.norm() error 2."
+    assert err_rel(b.norm(), tn.linalg.norm(b.full())) < 1e-13, "Test TT.norm() error 3."
+
+    c = tntt.random([5000], [1, 1], dtype=dtype)
+    assert err_rel(c.norm(), tn.linalg.norm(c.full())) < 1e-13, "Test TT.norm() error 4 (d=1)."
+
 @pytest.mark.parametrize("dtype", parameters)
 def test_kron(dtype):
     """
@@ -29,3 +29,73 @@ def test_set_core():
     assert list(A.N) == [6, 4, 5], "Set core error: TTM case"
     assert list(A.M) == [5, 6, 4], "Set core error: TTM case"
 
+
+def test_is_cuda():
+    '''
+    Test the device check.
+    '''
+    x = tntt.random([4, 5, 6], [1, 2, 3, 1], dtype=basic_dtype)
+
+    assert not x.is_cuda(), "is_cuda error: TT on CPU"
+    if tn.cuda.is_available():
+        assert x.cuda().is_cuda(), "is_cuda error: TT on GPU"
+
+
+def test_low_precision():
+    '''
+    Test the conversion to low precision dtypes.
+    '''
+    x = tntt.random([4, 5, 6], [1, 2, 3, 1], dtype=tn.float64)
+    flag_matmul, flag_cudnn = tn.backends.cuda.matmul.allow_tf32, tn.backends.cudnn.allow_tf32
+
+    y = x.tf32()
+    assert all(c.dtype == tn.float32 for c in y.cores), "tf32 error: dtype"
+    assert tn.backends.cuda.matmul.allow_tf32, "tf32 error: flag not set"
+    assert tn.linalg.norm(y.full().to(tn.float64)-x.full())/tn.linalg.norm(x.full()) < 1e-5, "tf32 error: values"
+
+    tn.backends.cuda.matmul.allow_tf32, tn.backends.cudnn.allow_tf32 = flag_matmul, flag_cudnn
+
+    z = x.to(dtype=tn.bfloat16)
+    assert all(c.dtype == tn.bfloat16 for c in z.cores), "bfloat16 error: dtype"
+
+
+def test_result_metadata():
+    '''
+    Test the sizes and ranks of the results of the arithmetic operations (built without validating the cores).
+    '''
+    x = tntt.random([2, 3, 4, 5], [1, 2, 3, 2, 1], dtype=tn.float64)
+    y = tntt.random([2, 3, 4, 5], [1, 3, 2, 2, 1], dtype=tn.float64)
+    A = tntt.random([(2, 3), (3, 3), (4, 2), (5, 2)], [1, 2, 3, 2, 1], dtype=tn.float64)
+    B = tntt.random([(3, 2), (3, 3), (2, 2), (2, 4)], [1, 2, 3, 2, 1], dtype=tn.float64)
+
+    z = tntt.random([4, 5], [1, 2, 1], dtype=tn.float64)
+
+    for t in [x+y, x-y, x*y, x+1, 2*x, 0*x, x/2, -x, +x, x+z, x-z, x*z, x**y, x.conj(), x.clone(), x.detach(),
+              A+A, A*A, A@B, B@x[:, :, :2, :4], x@A, A.t(), A**B, 0*A, x.to_ttm(), x[1, :, None, 2:4, 3], A[1, :, 0, :, 2, :, 1, :]]:
+        ref = tntt.TT(t.cores)
+        assert t.R == ref.R and t.N == ref.N and t.shape == ref.shape and t.is_ttm == ref.is_ttm, "Wrong sizes or ranks of the result."
+        if t.is_ttm:
+            assert t.M == ref.M, "Wrong row sizes of the result."
+
+def test_numel():
+    '''
+    Test the number of stored entries.
+    '''
+    x = tntt.random([2, 3, 4], [1, 2, 5, 1], dtype=basic_dtype)
+    A = tntt.random([(2, 3), (4, 5)], [1, 3, 1], dtype=basic_dtype)
+
+    assert tntt.numel(x) == 2*2 + 2*3*5 + 5*4, "numel() error: TT case"
+    assert tntt.numel(A) == 2*3*3 + 3*4*5, "numel() error: TTM case"
+
+def test_rank1TT():
+    '''
+    Test the construction of rank 1 TTs from vectors.
+    '''
+    vs = [tn.rand(3, dtype=tn.float64), tn.rand(4, dtype=tn.float64), tn.rand(5, dtype=tn.float64)]
+    x = tntt.rank1TT(vs)
+    assert x.R == [1, 1, 1, 1], "rank1TT() error: ranks"
+    assert err_rel(x.full(), tn.einsum('i,j,k->ijk', *vs)) < 1e-14, "rank1TT() error: list of vectors"
+
+    V = tn.rand(3, 4, dtype=tn.float64)
+    y = tntt.rank1TT(V)
+    assert err_rel(y.full(), tn.einsum('i,j,k->ijk', V[0], V[1], V[2])) < 1e-14, "rank1TT() error: stacked vectors"
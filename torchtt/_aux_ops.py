@@ -4,6 +4,8 @@ Additional operations.
 @author: ion
 """
 import torch as tn
+import opt_einsum as oe
+import functools
 
 
 def apply_mask(cores, R, indices):
@@ -33,10 +35,70 @@ def apply_mask(cores, R, indices):
     return tn.squeeze(result)
 
 
+@functools.lru_cache(maxsize=512)
+def _contract_expression(subscripts, *shapes):
+    """
+    Plans an einsum contraction for the given operand shapes. The expressions are cached.
+
+    Args:
+        subscripts (str): the einsum subscripts.
+        shapes (tuple[int]): the shapes of the operands.
+
+    Returns:
+        opt_einsum.contract.ContractExpression: the contraction.
+    """
+    return oe.contract_expression(subscripts, *shapes)
+
+
+def contract(subscripts, *operands):
+    """
+    Evaluates an einsum contraction (same semantics as `torch.einsum()`).
+    The contraction is planned once per subscripts and operand shapes and reused afterwards, which avoids the path computation in the loops over the cores.
+
+    Args:
+        subscripts (str): the einsum subscripts.
+        operands (torch.tensor): the operands.
+
+    Returns:
+        torch.tensor: the result.
+    """
+    return _contract_expression(subscripts, *(tuple(o.shape) for o in operands))(*operands)
+
+
+@functools.lru_cache(maxsize=128)
+def _dense_matvec_expression(core_shapes, other_shape):
+    """
+    Plans the contraction of a TT-matrix with a full tensor.
+    The contraction order is optimized once for the given shapes (ranks, mode sizes and batch sizes) and the resulting expression is cached.
+    The order is searched with dynamic programming: the greedy search merges pairs of TT-matrix cores into large intermediates instead of sweeping the tensor.
+
+    Args:
+        core_shapes (tuple[tuple[int]]): the shapes of the TT-matrix cores.
+        other_shape (tuple[int]): the shape of the full tensor B1 x ... x Bn x N1 x ... x Nd.
+
+    Returns:
+        opt_einsum.contract.ContractExpression: the contraction taking the cores and the tensor as arguments.
+    """
+    d = len(core_shapes)
+    b = len(other_shape) - d
+    # symbols: batch modes, ranks (d+1), row modes (d), column modes (d)
+    batch = [oe.get_symbol(k) for k in range(b)]
+    ranks = [oe.get_symbol(b+k) for k in range(d+1)]
+    rows = [oe.get_symbol(b+d+1+k) for k in range(d)]
+    cols = [oe.get_symbol(b+2*d+1+k) for k in range(d)]
+
+    operands = [ranks[k]+rows[k]+cols[k]+ranks[k+1] for k in range(d)]
+    operands.append(''.join(batch+cols))
+    eq = ','.join(operands) + '->' + ''.join(batch+rows)
+
+    return oe.contract_expression(eq, *core_shapes, other_shape, optimize='dp')
+
+
 def dense_matvec(cores, other):
     """
     Performs multiplication between a TT-matrix and a full tensor.
     Compatible to tailing dimensions broadcasting.
+    The contraction path is planned once per shape profile and reused (see `_dense_matvec_expression()`).
 
     Args:
         cores (list[torch.tensor]): the TT-cores of the TT-matrix. The TT-matrix should be of shape (M1 x ... x Md) x (N1 x ... x Nd). 
@@ -45,16 +107,139 @@ def dense_matvec(cores, other):
     Returns:
         torch.tensor: The result. Shape is B1 x ... x Bn x M1 x ... x Md.  
     """
-    result = tn.unsqueeze(other,-1)
+    expression = _dense_matvec_expression(
+        tuple(tuple(c.shape) for c in cores), tuple(other.shape))
 
-    d = len(cores)
-    D = len(other.shape)
+    return expression(*cores, other)
+
+@functools.lru_cache(maxsize=256)
+def _dot_expression(shapes_a, shapes_b):
+    """
+    Builds the contraction of the dot product of two TT-tensors for the given core shapes. The expressions are cached.
+    The operands are the cores of both tensors interleaved (a1, b1, a2, b2, ...).
+    No path search is needed: the zipper order is optimal (the interface matrix absorbs the next core of a, then the next core of b).
 
+    Args:
+        shapes_a (tuple[tuple[int]]): the shapes of the cores of the first tensor.
+        shapes_b (tuple[tuple[int]]): the shapes of the cores of the second tensor.
+
+    Returns:
+        opt_einsum.contract.ContractExpression: the contraction.
+    """
+    d = len(shapes_a)
+    # symbols for the ranks of a, the ranks of b and the modes
+    terms = []
     for i in range(d):
-        result = tn.tensordot(result,cores[i],([D-d,-1],[2,0]))
-    result = tn.squeeze(result,-1)
+        terms.append(oe.get_symbol(i)+oe.get_symbol(2*d+2+i)+oe.get_symbol(i+1))
+        terms.append(oe.get_symbol(d+1+i)+oe.get_symbol(2*d+2+i)+oe.get_symbol(d+2+i))
+    # the first pair is contracted, then the interface (last operand) with the next core (first operand)
+    path = [(0, 1)] + [(0, n-1) for n in range(2*d-1, 1, -1)]
+    shapes = [s for pair in zip(shapes_a, shapes_b) for s in pair]
+
+    return oe.contract_expression(','.join(terms)+'->', *shapes, optimize=path)
+
+
+def dot_cores(a_cores, b_cores):
+    """
+    Computes the dot product of two TT-tensors with the same shape as a single contraction.
+    The contraction is built once per core shapes and reused afterwards (see `_dot_expression()`).
+
+    Args:
+        a_cores (list[torch.tensor]): the cores of the first tensor.
+        b_cores (list[torch.tensor]): the cores of the second tensor (no conjugation is applied).
+
+    Returns:
+        torch.tensor: the result (0d).
+    """
+    expression = _dot_expression(tuple(tuple(c.shape) for c in a_cores), tuple(tuple(c.shape) for c in b_cores))
+
+    return expression(*[c for pair in zip(a_cores, b_cores) for c in pair])
+
+
+def dot_cores_mixed(a_cores, b_cores, compute_dtype):
+    """
+    Computes the dot product of two TT-tensors with the same shape, where the product of every step is evaluated in a lower precision.
+    Only the operands of each step are cast to `compute_dtype`. The interface matrix is kept in the promoted dtype of the cores and is scaled by its largest entry before the cast (avoids the overflow for float16).
+
+    Args:
+        a_cores (list[torch.tensor]): the cores of the first tensor.
+        b_cores (list[torch.tensor]): the cores of the second tensor (no conjugation is applied).
+        compute_dtype (torch.dtype): the dtype of the products.
+
+    Returns:
+        torch.tensor: the result (0d) in the promoted dtype of the cores.
+    """
+    dtype = tn.promote_types(a_cores[0].dtype, b_cores[0].dtype)
+    tiny = tn.finfo(dtype).tiny
+    result = None
+    for ca, cb in zip(a_cores, b_cores):
+        if result is None:
+            # the first cores have the rank 1 on the left
+            step = contract('aim,ain->mn', ca.to(compute_dtype), cb.to(compute_dtype))
+            result = step.to(dtype)
+        else:
+            scale = tn.abs(result).amax().clamp_min(tiny)
+            step = contract('ab,aim,bin->mn', (result / scale).to(compute_dtype), ca.to(compute_dtype), cb.to(compute_dtype))
+            result = step.to(dtype) * scale
+
+    return tn.reshape(result, [])
+
+
+def absorb_right(core, mat):
+    """
+    Multiplies the last rank of a core with a matrix (a single GEMM over the flattened leading dimensions).
+
+    Args:
+        core (torch.tensor): the core with the shape r1 x ... x r2.
+        mat (torch.tensor): the matrix with the shape r2 x r.
+
+    Returns:
+        torch.tensor: the core with the shape r1 x ... x r.
+    """
+    if core.shape[-1] == 1:
+        # rank 1 product (a scalar or an outer product): broadcasting is enough
+        return core * tn.reshape(mat, [-1])
+    return tn.reshape(tn.reshape(core, [-1, core.shape[-1]]) @ mat, list(core.shape[:-1]) + [mat.shape[1]])
+
+
+def absorb_left(mat, core):
+    """
+    Multiplies a matrix with the first rank of a core (a single GEMM over the flattened trailing dimensions).
+
+    Args:
+        mat (torch.tensor): the matrix with the shape r x r1.
+        core (torch.tensor): the core with the shape r1 x ... x r2.
+
+    Returns:
+        torch.tensor: the core with the shape r x ... x r2.
+    """
+    if core.shape[0] == 1:
+        # rank 1 product (a scalar or an outer product): broadcasting is enough
+        return tn.reshape(mat, [-1] + [1] * (core.dim() - 1)) * core
+    return tn.reshape(mat @ tn.reshape(core, [core.shape[0], -1]), [mat.shape[0]] + list(core.shape[1:]))
+
+
+def norm_cores(cores):
+    """
+    Computes the Frobenius norm of a TT object by orthogonalizing the cores from left to right.
+    Only the R factors of the QR decompositions are kept. Wide matrices are carried without a QR.
+    The last QR is skipped if the direct product with the last core is cheaper (the last core has fewer columns than its rank).
+    Gradients are not supported.
+
+    Args:
+        cores (list[torch.tensor]): the cores (TT or TT-matrix).
+
+    Returns:
+        torch.tensor: the norm.
+    """
+    core_now = cores[0].reshape(-1, cores[0].shape[-1])
+    for i in range(len(cores)-1):
+        core_next = cores[i+1].reshape(cores[i+1].shape[0], -1)
+        if core_now.shape[0] > core_now.shape[1] and (i < len(cores)-2 or core_next.shape[1] > core_now.shape[1]):
+            core_now = tn.linalg.qr(core_now, mode='r')[1]
+        core_now = (core_now @ core_next).reshape(-1, cores[i+1].shape[-1])
+    return tn.linalg.vector_norm(core_now)
 
-    return result
 
 def bilinear_form_aux(x_cores, A_cores, y_cores, d):
     """
@@ -9,14 +9,16 @@ import numpy as np
 
 
         
-def QR(mat):
+def QR(mat, no_gpu = False):
     """
-    Compute the QR decomposition. Backend can be changed.
+    Compute the reduced QR decomposition. Backend can be changed.
 
     Parameters
     ----------
     mat : tn array
         DESCRIPTION.
+    no_gpu : bool, optional
+        if the matrix is on the GPU, the factorization is performed on the CPU and the factors are moved back (faster for the small matrices of the TT-cores). The default is False.
 
     Returns
     -------
@@ -24,6 +26,9 @@ def QR(mat):
     R : the R matrix
 
     """
+    if no_gpu and mat.is_cuda:
+        Q,R = tn.linalg.qr(mat.cpu())
+        return Q.to(mat.device), R.to(mat.device)
     Q,R = tn.linalg.qr(mat)
     return Q, R
     
@@ -67,6 +72,8 @@ def lr_orthogonal(tt_cores, R, is_ttm, no_gpu = False):
     ----------
     tt_cores : list of torch tensors.
         The TT-cores as a list.
+    no_gpu : bool, optional
+        perform the QR decompositions of the cores on the CPU (see QR()). The default is False.
 
     Returns
     -------
@@ -92,7 +99,7 @@ def lr_orthogonal(tt_cores, R, is_ttm, no_gpu = False):
             core_now = tn.reshape(core_now,[core_now.shape[0]*core_now.shape[1],-1])
             
         # perform QR
-        Qmat, Rmat = QR(core_now)
+        Qmat, Rmat = QR(core_now, no_gpu)
         core_now= Qmat
              
         # take next core
@@ -120,6 +127,8 @@ def rl_orthogonal(tt_cores, R, is_ttm, no_gpu = False):
     ----------
     tt_cores : list of torch tensors.
         The TT-cores as a list.
+    no_gpu : bool, optional
+        perform the QR decompositions of the cores on the CPU (see QR()). The default is False.
 
     Returns
     -------
@@ -145,7 +154,7 @@ def rl_orthogonal(tt_cores, R, is_ttm, no_gpu = False):
         
         # perform QR
         
-        Qmat, Rmat = QR(core_now)
+        Qmat, Rmat = QR(core_now, no_gpu)
             # print('QR ',list(Qmat.shape),list(Rmat.shape))
         rnew = min([core_now.shape[0],core_now.shape[1]])
         rnew = Rmat.shape[0]
@@ -166,7 +175,7 @@ def rl_orthogonal(tt_cores, R, is_ttm, no_gpu = False):
 
     
 
-def round_tt(tt_cores,R,eps,Rmax,is_ttm=False):
+def round_tt(tt_cores,R,eps,Rmax,is_ttm=False,no_gpu=False,orthogonal=None):
     """
     Rounds a TT-tensor (tt_cores have to be orthogonal)
 
@@ -180,6 +189,11 @@ def round_tt(tt_cores,R,eps,Rmax,is_ttm=False):
         desired rounding accuracy.
     Rmax : list of integers
         the maximum rank that is allowed.
+    no_gpu : bool, optional
+        perform the orthogonalization QR decompositions on the CPU (see QR()). The default is False.
+    orthogonal : str, optional
+        the known orthogonality of the cores: 'left' (cores 1..d-1 are left orthogonal) or 'right' (cores 2..d are right orthogonal).
+        In both cases the orthogonalization is skipped. The default is None (the cores are orthogonalized).
 
     Returns
     -------
@@ -193,10 +207,31 @@ def round_tt(tt_cores,R,eps,Rmax,is_ttm=False):
     if d == 1:
         tt_cores = [tt_cores[0].clone()]
         return tt_cores, R
-    tt_cores, R = lr_orthogonal(tt_cores, R, is_ttm)
-    core_now = tt_cores[-1]
     eps = eps / np.sqrt(d-1) 
 
+    if orthogonal == 'right':
+        # the norm is in the first core: truncate from left to right (the result is left orthogonal)
+        tt_cores = list(tt_cores)
+        for i in range(d-1):
+            core_now = tn.reshape(tt_cores[i],[-1,R[i+1]])
+            core_next = tn.reshape(tt_cores[i+1],[R[i+1],-1])
+
+            U, S, V = SVD(core_now)
+            r_now = _truncation_rank(S,eps,Rmax[i+1])
+
+            V = tn.diag(S[:r_now]) @ V[:r_now,:]
+            R[i+1] = r_now
+            tt_cores[i] = tn.reshape(U[:,:r_now],[R[i]]+list(tt_cores[i].shape[1:-1])+[R[i+1]])
+            tt_cores[i+1] = tn.reshape(V @ core_next,[R[i+1]]+list(tt_cores[i+1].shape[1:-1])+[R[i+2]])
+
+        return tt_cores, R
+
+    if orthogonal == 'left':
+        tt_cores = list(tt_cores)
+    else:
+        tt_cores, R = lr_orthogonal(tt_cores, R, is_ttm, no_gpu)
+    core_now = tt_cores[-1]
+
     
     for i in range(d-1,0,-1):
         core_next = tt_cores[i-1]
@@ -206,10 +241,7 @@ def round_tt(tt_cores,R,eps,Rmax,is_ttm=False):
         
         
         U, S, V = SVD(core_now)
-        if S.is_cuda:
-            r_now = min([Rmax[i],rank_chop(S.cpu().numpy(),tn.linalg.norm(S).cpu().numpy()*eps)])
-        else:
-            r_now = min([Rmax[i],rank_chop(S.numpy(),tn.linalg.norm(S).numpy()*eps)])
+        r_now = _truncation_rank(S,eps,Rmax[i])
     
         U = U[:,:r_now]
         S = S[:r_now]
@@ -227,6 +259,29 @@ def round_tt(tt_cores,R,eps,Rmax,is_ttm=False):
     
     return tt_cores, R
 
+def _truncation_rank(S,eps,rmax):
+    """
+    Computes the rank after truncating the singular values with the relative accuracy eps.
+
+    Parameters
+    ----------
+    S : torch tensor
+        the singular values.
+    eps : double
+        the relative accuracy.
+    rmax : int
+        the maximum rank.
+
+    Returns
+    -------
+    int
+        the rank.
+    """
+    if S.is_cuda:
+        return min([rmax,rank_chop(S.cpu().numpy(),tn.linalg.norm(S).cpu().numpy()*eps)])
+    else:
+        return min([rmax,rank_chop(S.numpy(),tn.linalg.norm(S).numpy()*eps)])
+
     
 
 def mat_to_tt(A,M,N,eps,rmax = 1000,is_sparse=False):
@@ -8,14 +8,104 @@ from torchtt._decomposition import mat_to_tt, to_tt, lr_orthogonal, round_tt, rl
 from torchtt._division import amen_divide
 import numpy as np
 import math
+import functools
 from torchtt._dmrg import dmrg_matvec
-from torchtt._aux_ops import apply_mask, dense_matvec, bilinear_form_aux
+from torchtt._aux_ops import apply_mask, dense_matvec, bilinear_form_aux, contract, absorb_left, absorb_right, dot_cores, dot_cores_mixed
 from torchtt.errors import *
 # from ._tt_base import TT
 import torchtt._tt_base
 import sys
 
 
+def _split_buffer(buffer, shapes):
+    """
+    Splits a flat buffer into views with the given shapes. The cores created this way share one allocation.
+
+    Args:
+        buffer (torch.tensor): the 1d buffer. Its size must be the sum of the sizes of the shapes.
+        shapes (list[list[int]]): the shapes of the views.
+
+    Returns:
+        list[torch.tensor]: the views.
+    """
+    sizes = [math.prod(s) for s in shapes]
+    return [b.view(s) for b, s in zip(tn.split(buffer, sizes), shapes)]
+
+
+def _core_shapes(shape, R):
+    """
+    Computes the shapes of the cores of a TT object with the given shape and rank.
+    Whether a TT-matrix or a TT-tensor is created is decided once from the first mode.
+
+    Args:
+        shape (list[int] | list[tuple[int]]): the shape. Tuples of ints stand for a TT-matrix.
+        R (list[int]): the rank.
+
+    Returns:
+        list[list[int]]: the shapes of the cores.
+    """
+    if isinstance(shape[0], tuple):
+        M, N = shape_tuple_to_mn(shape)
+        return [[R[i], M[i], N[i], R[i+1]] for i in range(len(N))]
+    return [[R[i], shape[i], R[i+1]] for i in range(len(shape))]
+
+
+@functools.lru_cache(maxsize=128)
+def _reshape_plan(modes, shape):
+    """
+    Computes the sequence of core operations performed by `torchtt.reshape()`. The plan only depends on the mode sizes and is cached.
+    The operations are ('split', sizes): the current core is split into the given modes (the last one is the remainder that is kept as current core),
+    ('emit', idx): the current core is final and the core idx becomes the current one (None after the last core) and ('merge', idx): the current core is merged with the core idx.
+
+    Args:
+        modes (tuple[tuple[int]]): the modes of the input cores. The tuples have length 1 for TT-tensors and 2 for TT-matrices.
+        shape (tuple[tuple[int]]): the target modes in the same format.
+
+    Returns:
+        tuple[tuple, int]: the operations and the number of trailing modes of size 1 that are not covered by the input cores.
+    """
+    plan = []
+    idx = 0
+    idx_shape = 0
+    n = modes[0]
+    while True:
+        target = shape[idx_shape]
+        if all(a % b == 0 for a, b in zip(n, target)):
+            if any(a // b > 1 for a, b in zip(n, target)):
+                if len(n) == 1:
+                    # all the consecutive target modes the core splits into are separated at once (the remainder is last)
+                    sizes = [target[0]]
+                    while idx_shape+len(sizes) < len(shape) and (n[0] // math.prod(sizes)) % shape[idx_shape+len(sizes)][0] == 0 \
+                            and n[0] // math.prod(sizes) > shape[idx_shape+len(sizes)][0]:
+                        sizes.append(shape[idx_shape+len(sizes)][0])
+                    sizes.append(n[0] // math.prod(sizes))
+                    plan.append(('split', tuple(sizes)))
+                    n = (sizes[-1],)
+                    idx_shape += len(sizes)-2
+                else:
+                    rest = tuple(a // b for a, b in zip(n, target))
+                    plan.append(('split', (tuple(target), rest)))
+                    n = rest
+            else:
+                if idx == len(modes)-1:
+                    plan.append(('emit', None))
+                    break
+                idx += 1
+                plan.append(('emit', idx))
+                n = modes[idx]
+            idx_shape += 1
+            if idx_shape == len(shape):
+                break
+        else:
+            idx += 1
+            if idx >= len(modes):
+                break
+            plan.append(('merge', idx))
+            n = tuple(a*b for a, b in zip(n, modes[idx]))
+
+    return tuple(plan), max(len(shape)-idx_shape-1, 0)
+
+
 def eye(shape, dtype=tn.float64, device=None):
     """
     Construct the TT decomposition of a multidimensional identity matrix.
@@ -32,8 +122,12 @@ def eye(shape, dtype=tn.float64, device=None):
 
     shape = list(shape)
 
-    cores = [tn.unsqueeze(tn.unsqueeze(
-        tn.eye(s, dtype=dtype, device=device), 0), 3) for s in shape]
+    # one zero buffer for all the cores, the diagonals are set with a single scatter
+    offsets = np.cumsum([0] + [s*s for s in shape])
+    buffer = tn.zeros(int(offsets[-1]), dtype=dtype, device=device)
+    diagonals = [o + k*(s+1) for o, s in zip(offsets, shape) for k in range(s)]
+    buffer[tn.tensor(diagonals, dtype=tn.int64, device=device)] = 1
+    cores = _split_buffer(buffer, [[1, s, s, 1] for s in shape])
 
     return torchtt._tt_base.TT(cores)
 
@@ -55,16 +149,9 @@ def zeros(shape, dtype=tn.float64, device=None):
         torchtt.TT: the zero tensor.
     """
     if isinstance(shape, list):
-        d = len(shape)
-        if isinstance(shape[0], tuple):
-            # we create a TT-matrix
-            cores = [tn.zeros([1, shape[i][0], shape[i][1], 1],
-                              dtype=dtype, device=device) for i in range(d)]
-
-        else:
-            # we create a TT-tensor
-            cores = [tn.zeros([1, shape[i], 1], dtype=dtype,
-                              device=device) for i in range(d)]
+        shapes = _core_shapes(shape, [1]*(len(shape)+1))
+        cores = _split_buffer(tn.zeros(sum(math.prod(s) for s in shapes),
+                              dtype=dtype, device=device), shapes)
 
     else:
         raise InvalidArguments('Shape must be a list.')
@@ -77,6 +164,7 @@ def kron(first, second):
     Computes the tensor Kronecker product.
     If None is provided as input the reult is the other tensor.
     If A is N_1 x ... x N_d and B is M_1 x ... x M_p, then kron(A,B) is N_1 x ... x N_d x M_1 x ... x M_p
+    The cores of the result are shared with the arguments (no copy is made).
 
 
     Args:
@@ -91,20 +179,19 @@ def kron(first, second):
         torchtt.TT: the result.
     """
     if first == None and isinstance(second, torchtt._tt_base.TT):
-        cores_new = [c.clone() for c in second.cores]
-        result = torchtt._tt_base.TT(cores_new)
+        result = torchtt._tt_base.TT._from_cores(
+            list(second.cores), second.N, second.R, second.M if second.is_ttm else None)
     elif second == None and isinstance(first, torchtt._tt_base.TT):
-        cores_new = [c.clone() for c in first.cores]
-        result = torchtt._tt_base.TT(cores_new)
+        result = torchtt._tt_base.TT._from_cores(
+            list(first.cores), first.N, first.R, first.M if first.is_ttm else None)
     elif isinstance(first, torchtt._tt_base.TT) and isinstance(second, torchtt._tt_base.TT):
         if first.is_ttm != second.is_ttm:
             raise IncompatibleTypes(
                 'Incompatible data types (make sure both are either TT-matrices or TT-tensors).')
 
         # concatenate the result
-        cores_new = [c.clone() for c in first.cores] + [c.clone()
-                                                        for c in second.cores]
-        result = torchtt._tt_base.TT(cores_new)
+        result = torchtt._tt_base.TT._from_cores(first.cores + second.cores, first.N + second.N, first.R[:-1] + second.R,
+                                                 first.M + second.M if first.is_ttm else None)
     else:
         raise InvalidArguments('Invalid arguments.')
     return result
@@ -131,15 +218,9 @@ def ones(shape, dtype=tn.float64, device=None):
         if d == 0:
             return torchtt._tt_base.TT(None)
         else:
-            if isinstance(shape[0], tuple):
-                # we create a TT-matrix
-                cores = [tn.ones([1, shape[i][0], shape[i][1], 1],
-                                 dtype=dtype, device=device) for i in range(d)]
-
-            else:
-                # we create a TT-tensor
-                cores = [tn.ones([1, shape[i], 1], dtype=dtype,
-                                 device=device) for i in range(d)]
+            shapes = _core_shapes(shape, [1]*(d+1))
+            cores = _split_buffer(tn.ones(sum(math.prod(s) for s in shapes),
+                                  dtype=dtype, device=device), shapes)
 
     else:
         raise InvalidArguments('Shape must be a list.')
@@ -292,11 +373,11 @@ def random(N, R, dtype=tn.float64, device=None):
     elif len(N)+1 != len(R) or R[0] != 1 or R[-1] != 1 or len(N) == 0:
         raise InvalidArguments('Check if N and R are right.')
 
-    cores = []
+    shapes = _core_shapes(N, R)
 
-    for i in range(len(N)):
-        cores.append(tn.randn([R[i], N[i][0], N[i][1], R[i+1]] if isinstance(
-            N[i], tuple) else [R[i], N[i], R[i+1]], dtype=dtype, device=device))
+    # all the entries are sampled at once
+    cores = _split_buffer(tn.randn(sum(math.prod(s) for s in shapes),
+                          dtype=dtype, device=device), shapes)
 
     T = torchtt._tt_base.TT(cores)
 
@@ -322,10 +403,10 @@ def randn(N, R, var=1.0, dtype=tn.float64, device=None):
     d = len(N)
     v1 = var / np.prod(R)
     v = v1**(1/d)
-    cores = [None] * d
-    for i in range(d):
-        cores[i] = tn.randn([R[i], N[i][0], N[i][1], R[i+1]] if isinstance(
-            N[i], tuple) else [R[i], N[i], R[i+1]], dtype=dtype, device=device)*np.sqrt(v)
+    shapes = _core_shapes(N, R)
+    # all the entries are sampled and scaled at once
+    cores = _split_buffer(tn.randn(sum(math.prod(s) for s in shapes),
+                          dtype=dtype, device=device)*np.sqrt(v), shapes)
 
     return torchtt._tt_base.TT(cores)
 
@@ -359,95 +440,76 @@ def reshape(tens, shape, eps=1e-16, rmax=sys.maxsize):
         if np.prod(tens.N) != np.prod(N) or np.prod(tens.M) != np.prod(M):
             raise ShapeMismatch(
                 'The product of modes should remain equal. Check the given shape.')
+        plan, _ = _reshape_plan(tuple(zip(tens.M, tens.N)), tuple(tuple(t) for t in shape))
         core = cores[0]
         cores_new = []
 
-        idx = 0
-        idx_shape = 0
-
-        while True:
-            if core.shape[1] % M[idx_shape] == 0 and core.shape[2] % N[idx_shape] == 0:
-                if core.shape[1] // M[idx_shape] > 1 or core.shape[2] // N[idx_shape] > 1:
-                    m1 = M[idx_shape]
-                    m2 = core.shape[1] // m1
-                    n1 = N[idx_shape]
-                    n2 = core.shape[2] // n1
-                    r1 = core.shape[0]
-                    r2 = core.shape[-1]
-                    tmp = tn.reshape(core, [r1*m1, m2, n1, n2*r2])
+        for op, arg in plan:
+            if op == 'split':
+                (m1, n1), (m2, n2) = arg
+                r1 = core.shape[0]
+                r2 = core.shape[-1]
+                tmp = tn.reshape(core, [r1*m1, m2, n1, n2*r2])
 
-                    crz, _ = mat_to_tt(
-                        tmp, [r1*m1, m2], [n1, n2*r2], eps/np.sqrt(dfin-1), rmax)
+                crz, _ = mat_to_tt(
+                    tmp, [r1*m1, m2], [n1, n2*r2], eps/np.sqrt(dfin-1), rmax)
 
-                    cores_new.append(tn.reshape(crz[0], [r1, m1, n1, -1]))
+                cores_new.append(tn.reshape(crz[0], [r1, m1, n1, -1]))
 
-                    core = tn.reshape(crz[1], [-1, m2, n2, r2])
-                else:
-                    cores_new.append(core+0)
-                    if idx == len(cores)-1:
-                        break
-                    else:
-                        idx += 1
-                        core = cores[idx]
-                idx_shape += 1
-                if idx_shape == len(shape):
-                    break
+                core = tn.reshape(crz[1], [-1, m2, n2, r2])
+            elif op == 'emit':
+                cores_new.append(core)
+                if arg is not None:
+                    core = cores[arg]
             else:
-                idx += 1
-                if idx >= len(cores):
-                    break
-
-                core = tn.einsum('ijkl,lmno->ijmkno', core, cores[idx])
+                # merge with the next core: one GEMM over the common rank, then interleave the modes
+                m1, n1 = core.shape[1], core.shape[2]
+                core = tn.permute(tn.tensordot(core, cores[arg], ([3], [0])), [0, 1, 3, 2, 4, 5])
                 core = tn.reshape(
-                    core, [core.shape[0], core.shape[1]*core.shape[2], -1, core.shape[-1]])
+                    core, [core.shape[0], m1*core.shape[2], n1*core.shape[4], core.shape[-1]])
 
     else:
         if np.prod(tens.N) != np.prod(shape):
             raise ShapeMismatch(
                 'The product of modes should remain equal. Check the given shape.')
 
+        plan, n_ones = _reshape_plan(tuple((n,) for n in tens.N), tuple((s,) for s in shape))
         core = cores[0]
         cores_new = []
 
-        idx = 0
-        idx_shape = 0
-        while True:
-            if core.shape[1] % shape[idx_shape] == 0:
-                if core.shape[1] // shape[idx_shape] > 1:
-                    s1 = shape[idx_shape]
-                    s2 = core.shape[1] // s1
-                    r1 = core.shape[0]
-                    r2 = core.shape[2]
-                    tmp = tn.reshape(core, [r1*s1, s2*r2])
-
-                    crz, _ = to_tt(tmp, tmp.shape, eps/np.sqrt(dfin-1), rmax)
-
-                    cores_new.append(tn.reshape(crz[0], [r1, s1, -1]))
-
-                    core = tn.reshape(crz[1], [-1, s2, r2])
-                else:
-                    cores_new.append(core+0)
-                    if idx == len(cores)-1:
-                        break
-                    else:
-                        idx += 1
-                        core = cores[idx]
-                idx_shape += 1
-                if idx_shape == len(shape):
-                    break
+        for op, arg in plan:
+            if op == 'split':
+                sizes = list(arg)
+                r1 = core.shape[0]
+                r2 = core.shape[2]
+                if len(sizes) == 2 and min(r1*sizes[0], sizes[1]*r2) <= rmax:
+                    # a single split that needs no rank cap: the exact factorization is a QR (the rounding at the end truncates)
+                    Q, Rm = QR(tn.reshape(core, [r1*sizes[0], sizes[1]*r2]))
+                    cores_new.append(tn.reshape(Q, [r1, sizes[0], -1]))
+                    core = tn.reshape(Rm, [-1, sizes[1], r2])
+                    continue
+
+                tmp = tn.reshape(core, [r1*sizes[0]] + sizes[1:-1] + [sizes[-1]*r2])
+
+                # every SVD of the sweep has the same accuracy eps/sqrt(dfin-1)
+                crz, _ = to_tt(tmp, list(tmp.shape), eps/np.sqrt(dfin-1)*np.sqrt(len(sizes)-1), rmax)
+
+                cores_new.append(tn.reshape(crz[0], [r1, sizes[0], -1]))
+                cores_new += crz[1:-1]
+
+                core = tn.reshape(crz[-1], [-1, sizes[-1], r2])
+            elif op == 'emit':
+                cores_new.append(core)
+                if arg is not None:
+                    core = cores[arg]
             else:
-                idx += 1
-                if idx >= len(cores):
-                    break
+                # merge with the next core: one GEMM over the common rank
+                core = tn.reshape(tn.reshape(core, [-1, core.shape[-1]]) @ tn.reshape(
+                    cores[arg], [cores[arg].shape[0], -1]), [core.shape[0], -1, cores[arg].shape[-1]])
 
-                core = tn.einsum('ijk,klm->ijlm', core, cores[idx])
-                core = tn.reshape(core, [core.shape[0], -1, core.shape[-1]])
-
-        idx_shape += 1
-        while idx_shape < len(shape):
+        for _ in range(n_ones):
             cores_new.append(
                 tn.ones((1, 1, 1), dtype=cores_new[-1].dtype, device=cores_new[-1].device))
-            idx_shape += 1
 
     return torchtt._tt_base.TT(cores_new).round(eps)
 
@@ -467,14 +529,16 @@ def meshgrid(vectors):
 
     Xs = []
     dtype = vectors[0].dtype
+    # the cores of ones are created once and shared by all the results
+    ones = [tn.ones((1, v.shape[0], 1), dtype=dtype, device=v.device) for v in vectors]
     for i in range(len(vectors)):
-        lst = [tn.ones((1, v.shape[0], 1), dtype=dtype) for v in vectors]
+        lst = list(ones)
         lst[i] = tn.reshape(vectors[i], [1, -1, 1])
         Xs.append(torchtt._tt_base.TT(lst))
     return Xs
 
 
-def dot(a, b, axis=None):
+def dot(a, b, axis=None, compute_dtype=None, scalar=False):
     """
     Computes the dot product between 2 tensors in TT format.
     If both a and b have identical mode sizes the result is the dot product.
@@ -492,21 +556,25 @@ def dot(a, b, axis=None):
             c = torchtt.randn([3,5,6],[1,2,2,1])
             print(torchtt.dot(a,b))
             print(torchtt.dot(a,c,[0,2,3]))
+            print(torchtt.dot(a,b,compute_dtype=torch.bfloat16))
 
 
     Args:
         a (torchtt.TT): the first tensor.
         b (torchtt.TT): the second tensor.
         axis (list[int], optional): the mode indices for index contraction. Defaults to None.
+        compute_dtype (torch.dtype, optional): if given, the products of the full dot product are computed in this dtype (e.g. torch.bfloat16 halves the memory traffic at the cost of accuracy), while the running interface and the result keep the dtype of the inputs. Must be complex for complex inputs. Ignored if axis is given. Defaults to None.
+        scalar (bool, optional): return the full dot product as a Python number (one explicit synchronization with the device) instead of a 0d tensor. Ignored if axis is given. Defaults to False.
 
     Raises:
         InvalidArguments: Both operands should be TT instances.
         NotImplementedError: Operation not implemented for TT-matrices.
         ShapeMismatch: Operands are not the same size.
         ShapeMismatch: Number of the modes of the first tensor must be equal with the second.
+        InvalidArguments: A real compute_dtype cannot be used for complex tensors.
 
     Returns:
-        float or torchtt.TT: the result. If no axis index is provided the result is a scalar otherwise a torchtt.TT object.
+        torch.tensor, float or torchtt.TT: the result. If no axis index is provided the result is a scalar (a 0d tensor, or a Python number if scalar is True) otherwise a torchtt.TT object.
     """
 
     if not isinstance(a, torchtt._tt_base.TT) or not isinstance(b, torchtt._tt_base.TT):
@@ -521,13 +589,19 @@ def dot(a, b, axis=None):
         if a.N != b.N:
             raise ShapeMismatch('Operands are not the same size.')
 
-        result = tn.tensor([[1.0]], dtype=a.cores[0].dtype,
-                           device=a.cores[0].device)
+        if compute_dtype is not None:
+            if (a.cores[0].is_complex() or b.cores[0].is_complex()) and not compute_dtype.is_complex:
+                raise InvalidArguments('A real compute_dtype cannot be used for complex tensors.')
+            # the products are computed in compute_dtype, the interface is kept in the dtype of the inputs
+            result = dot_cores_mixed(a.cores, [tn.conj(c) for c in b.cores], compute_dtype)
+        elif max(a.R) == 1 and max(b.R) == 1:
+            # both are rank 1: the product of the dot products of the cores
+            result = tn.prod(tn.stack([tn.vdot(cb.reshape(-1), ca.reshape(-1)) for ca, cb in zip(a.cores, b.cores)]))
+        else:
+            result = dot_cores(a.cores, [tn.conj(c) for c in b.cores])
 
-        for i in range(len(a.N)):
-            result = tn.einsum('ab,aim,bin->mn', result,
-                               a.cores[i], tn.conj(b.cores[i]))
-        result = tn.squeeze(result)
+        if scalar:
+            result = result.item()
     else:
         # partial case
         if a.is_ttm or b.is_ttm:
@@ -539,20 +613,41 @@ def dot(a, b, axis=None):
         # if a.N[axis] != b.N:
         #     raise Exception('Dimension mismatch.')
 
+        # the contracted modes give interface matrices (the rank of a times the rank of b). The product of consecutive ones is absorbed
+        # in the neighbouring free core on the side of its smaller dimension. The free cores carry the rank of b through an identity.
         k = 0  # index for the tensor b
         cores_new = []
-        rank_left = 1
+        pending = None  # product of the interface matrices since the last free core
+        rank_b = 1
         for i in range(len(a.N)):
             if i in axis:
-                cores_new.append(tn.conj(b.cores[k]))
-                rank_left = b.cores[k].shape[2]
+                core_b = tn.conj(b.cores[k])
                 k += 1
+                mat = contract('anb,pnq->apbq', a.cores[i], core_b)
+                mat = tn.reshape(mat, [mat.shape[0]*mat.shape[1], -1])
+                rank_b = core_b.shape[-1]
+                pending = mat if pending is None else pending @ mat
             else:
-                rank_right = b.cores[k].shape[0] if i+1 in axis else rank_left
-                cores_new.append(tn.conj(tn.einsum('ik,j->ijk', tn.eye(rank_left, rank_right,
-                                 dtype=a.cores[0].dtype), tn.ones([a.N[i]], dtype=a.cores[0].dtype))))
+                core = a.cores[i]
+                if rank_b > 1:
+                    eye = tn.eye(rank_b, dtype=core.dtype, device=core.device)
+                    core = tn.reshape(core[:, None, :, :, None]*eye[None, :, None, None, :],
+                                      [core.shape[0]*rank_b, core.shape[1], core.shape[2]*rank_b])
+                if pending is not None:
+                    if len(cores_new) > 0 and pending.shape[0] > pending.shape[1]:
+                        cores_new[-1] = absorb_right(cores_new[-1], pending)
+                    else:
+                        core = absorb_left(pending, core)
+                    pending = None
+                cores_new.append(core)
 
-        result = (a*torchtt._tt_base.TT(cores_new)).sum(axis)
+        if len(cores_new) == 0:
+            # all the modes are contracted
+            result = tn.reshape(pending, [])
+        else:
+            if pending is not None:
+                cores_new[-1] = absorb_right(cores_new[-1], pending)
+            result = torchtt._tt_base.TT(cores_new)
     return result
 
 
@@ -585,6 +680,63 @@ def bilinear_form(x, A, y):
     return bilinear_form_aux(x.cores, A.cores, y.cores, d)
 
 
+def dot_batch(a, bs):
+    """
+    Computes the dot products between a tensor and a list of tensors in TT format (the complex case is treated like in `torchtt.dot()`).
+    If all the tensors in the list have the same ranks, their cores are stacked and the products are computed together with batched GEMMs.
+
+    Examples:
+
+        .. code-block:: python
+
+            a = torchtt.randn([3,4,5],[1,2,2,1])
+            bs = [torchtt.randn([3,4,5],[1,3,3,1]) for _ in range(10)]
+            print(torchtt.dot_batch(a,bs))
+
+    Args:
+        a (torchtt.TT): the first tensor.
+        bs (list[torchtt.TT]): the second tensors.
+
+    Raises:
+        InvalidArguments: Both operands should be TT instances.
+        InvalidArguments: The list of tensors must not be empty.
+        NotImplementedError: Operation not implemented for TT-matrices.
+        ShapeMismatch: Operands are not the same size.
+
+    Returns:
+        torch.tensor: the dot products (1d tensor of length len(bs)).
+    """
+
+    if not isinstance(a, torchtt._tt_base.TT) or not all(isinstance(b, torchtt._tt_base.TT) for b in bs):
+        raise InvalidArguments('Both operands should be TT instances.')
+
+    if len(bs) == 0:
+        raise InvalidArguments('The list of tensors must not be empty.')
+    if a.is_ttm or any(b.is_ttm for b in bs):
+        raise NotImplementedError(
+            'Operation not implemented for TT-matrices.')
+    if any(a.N != b.N for b in bs):
+        raise ShapeMismatch('Operands are not the same size.')
+
+    if any(b.R != bs[0].R for b in bs):
+        # the cores cannot be stacked
+        return tn.stack([dot(a, b) for b in bs])
+
+    K = len(bs)
+    # the interface is kept as K x rank of b x rank of a
+    # the first cores have a leading rank 1 and start it directly (broadcast over the batch)
+    result = None
+    for i, core in enumerate(a.cores):
+        cores_b = tn.conj(tn.stack([b.cores[i] for b in bs]))
+        if result is None:
+            tmp = tn.reshape(core, [1, -1, core.shape[-1]])
+        else:
+            tmp = tn.reshape(tn.reshape(result, [-1, core.shape[0]]) @ tn.reshape(core, [core.shape[0], -1]), [K, -1, core.shape[-1]])
+        result = tn.reshape(cores_b, [K, -1, cores_b.shape[-1]]).transpose(1, 2) @ tmp
+
+    return tn.reshape(result, [K])
+
+
 def elementwise_divide(x, y, eps=1e-12, starting_tensor=None, nswp=50, kick=4, local_iterations=40, resets=2, preconditioner=None, verbose=False):
     """
     Perform the elemntwise division x/y of two tensors in the TT format using the AMEN method.
@@ -637,7 +789,10 @@ def numel(tensor):
         int: number of floats stored for the TT decomposition.
     """
 
-    return sum([tn.numel(tensor.cores[i]) for i in range(len(tensor.N))])
+    # computed from the sizes (no access to the cores)
+    R = tensor.R
+    sizes = [m*n for m, n in zip(tensor.M, tensor.N)] if tensor.is_ttm else tensor.N
+    return sum(r1*s*r2 for r1, s, r2 in zip(R[:-1], sizes, R[1:]))
 
 
 def diag(input):
@@ -738,10 +893,10 @@ def permute(input, dims, eps=1e-12):
                         R[k+1] = Q.shape[1]
                         cores[k] = tn.reshape(
                             Q, [cores[k].shape[0], cores[k].shape[1], cores[k].shape[2], -1])
-                        cores[k+1] = tn.einsum('ij,jkl->ikl', R, cores[k+1])
+                        cores[k+1] = absorb_left(R, cores[k+1])
 
                     n2 = [cores[i].shape[1], cores[i].shape[2]]
-                    core = tn.einsum('ijkl,lmno->ijkmno', cores[i], cores[i+1])
+                    core = contract('ijkl,lmno->ijkmno', cores[i], cores[i+1])
                     core = tn.permute(core, [0, 3, 4, 1, 2, 5])
                     U, S, V = SVD(tn.reshape(
                         core, [core.shape[0]*core.shape[1]*core.shape[2], -1]))
@@ -770,10 +925,10 @@ def permute(input, dims, eps=1e-12):
                         R[k+1] = Q.shape[1]
                         cores[k] = tn.reshape(
                             Q, [cores[k].shape[0], cores[k].shape[1], -1])
-                        cores[k+1] = tn.einsum('ij,jkl->ikl', R, cores[k+1])
+                        cores[k+1] = absorb_left(R, cores[k+1])
 
                     n2 = cores[i].shape[1]
-                    core = tn.einsum('ijk,klm->ijlm', cores[i], cores[i+1])
+                    core = contract('ijk,klm->ijlm', cores[i], cores[i+1])
                     core = tn.permute(core, [0, 2, 1, 3])
                     U, S, V = SVD(tn.reshape(
                         core, [core.shape[0]*core.shape[1], -1]))
@@ -985,14 +1140,16 @@ def pad(tensor, padding, value=0.0):
         raise InvalidArguments(
             "The number of paddings should not exceed the number of dimensions of the tensor.")
 
+    d = len(tensor.N)
     if tensor.is_ttm:
+        M, N = tensor.M, tensor.N
         cores = [c.clone() for c in tensor.cores]
-        for pad, k in zip(reversed(padding), reversed(range(len(tensor.N)))):
-            cores[k] = tnf.pad(cores[k], (1 if k < len(tensor.N)-1 else 0, 1 if k < len(tensor.N) -
+        for pad, k in zip(reversed(padding), reversed(range(d))):
+            cores[k] = tnf.pad(cores[k], (1 if k < d-1 else 0, 1 if k < d -
                                1 else 0, pad[0], pad[1], pad[0], pad[1], 1 if k > 0 else 0, 1 if k > 0 else 0), value=0)
             cores[k][0, :pad[0], :pad[0], 0] = value * \
                 tn.eye(pad[0], device=cores[k].device, dtype=cores[k].dtype)
-            cores[k][-1, (pad[0]+tensor.M[k]):, (pad[0]+tensor.N[k]):, -1] = value * \
+            cores[k][-1, (pad[0]+M[k]):, (pad[0]+N[k]):, -1] = value * \
                 tn.eye(pad[1], device=cores[k].device, dtype=cores[k].dtype)
             value = 1
     else:
@@ -1000,7 +1157,7 @@ def pad(tensor, padding, value=0.0):
         value = value/rprod
 
         cores = [c.clone() for c in tensor.cores]
-        for pad, k in zip(reversed(padding), reversed(range(len(tensor.N)))):
+        for pad, k in zip(reversed(padding), reversed(range(d))):
             cores[k] = tnf.pad(
                 cores[k], (0, 0, pad[0], pad[1], 0, 0), value=value)
             value = 1 if value != 0 else 0
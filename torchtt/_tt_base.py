@@ -3,23 +3,271 @@ This file implements the core TT class.
 """
 
 import torch as tn
-import torch.nn.functional as tnf
-from torchtt._decomposition import mat_to_tt, to_tt, lr_orthogonal, round_tt, rl_orthogonal, QR, SVD, rank_chop
+from torchtt._decomposition import mat_to_tt, to_tt, lr_orthogonal, round_tt, rl_orthogonal, SVD, rank_chop
 from torchtt._division import amen_divide
 import numpy as np
 import math
 from torchtt._dmrg import dmrg_matvec
-from torchtt._aux_ops import apply_mask, dense_matvec, bilinear_form_aux
+from torchtt._aux_ops import apply_mask, dense_matvec, bilinear_form_aux, absorb_left, absorb_right, norm_cores
 from torchtt.errors import *
 import torchtt._extras
 import sys
 
+# cores with at most this many entries are considered small (the per core overhead of the Python loops dominates)
+_SMALL_CORE_NUMEL = 4096
+
+
+def _add_cores(first, second, is_first, is_last, batched=False):
+    """
+    Builds the core of the sum of two TT objects by writing the two cores as diagonal blocks of a preallocated core.
+    The first core of the sum is the concatenation along the last rank and the last core is the concatenation along the first rank.
+    Modes of size 1 of the second core are broadcasted.
+
+    Args:
+        first (torch.tensor): the core of the first operand.
+        second (torch.tensor | float | int | numpy.generic): the core of the second operand. A scalar (number, numpy scalar or 0d tensor) stands for a constant core of rank 1 and is written directly into the result.
+        is_first (bool): the core is the first one in the train.
+        is_last (bool): the core is the last one in the train.
+        batched (bool, optional): the cores are stacked along a leading batch dimension. Defaults to False.
+
+    Returns:
+        torch.tensor: the resulting core.
+    """
+    if isinstance(second, np.generic):
+        # numpy scalars cannot be written into a torch tensor
+        second = second.item()
+    if is_first and is_last:
+        return first + second
+
+    b = (slice(None),) if batched else ()
+    r1, r2 = first.shape[len(b)], first.shape[-1]
+    if tn.is_tensor(second) and second.dim() > 0:
+        q1, q2 = second.shape[len(b)], second.shape[-1]
+    else:
+        q1, q2 = 1, 1
+    s1 = r1 if is_first else r1 + q1
+    s2 = r2 if is_last else r2 + q2
+
+    # every entry is written exactly once: the diagonal blocks are copied and only the off-diagonal blocks of the interior cores are zeroed
+    core = tn.empty(tuple(first.shape[:len(b)]) + (s1,) + tuple(first.shape[len(b)+1:-1]) + (s2,),
+                    dtype=tn.result_type(first, second), device=first.device)
+    core[b + (slice(None, r1), Ellipsis, slice(None, r2))] = first
+    core[b + (slice(s1-q1, None), Ellipsis, slice(s2-q2, None))] = second
+    if not is_first and not is_last:
+        core[b + (slice(None, r1), Ellipsis, slice(r2, None))] = 0
+        core[b + (slice(r1, None), Ellipsis, slice(None, r2))] = 0
+
+    return core
+
+
+def _mul_cores(first, second, batched=False):
+    """
+    Builds the core of the elementwise product of two TT objects.
+    The ranks are multiplied (Kronecker product) and the modes are multiplied elementwise (modes of size 1 of the second core are broadcasted).
+    The product is computed as a single broadcasted multiplication.
+
+    Args:
+        first (torch.tensor): the core of the first operand.
+        second (torch.tensor): the core of the second operand.
+        batched (bool, optional): the cores are stacked along a leading batch dimension. Defaults to False.
+
+    Returns:
+        torch.tensor: the resulting core.
+    """
+    if batched:
+        core = first[:, :, None, ..., None] * second[:, None, ..., None, :]
+        s = core.shape
+        return tn.reshape(core, [s[0], s[1]*s[2]] + list(s[3:-2]) + [s[-2]*s[-1]])
+
+    core = first[:, None, ..., None] * second[None, ..., None, :]
+    s = core.shape
+    return tn.reshape(core, [s[0]*s[1]] + list(s[2:-2]) + [s[-2]*s[-1]])
+
+
+def _corewise(fn, first, second):
+    """
+    Applies a binary core operation to the cores of two TT objects with the same number of cores.
+    If the interior cores (all except the first and the last) of each operand share the same shape and are small (see `_SMALL_CORE_NUMEL`), they are stacked and processed by one batched call instead of one call per core.
+    Larger cores are processed one by one (the launch overhead is negligible for them and stacking would copy both operands).
+
+    Args:
+        fn (Callable): the operation called as `fn(core1, core2, i, batched)`, where `i` is the index of the core (1 for the stacked interior cores).
+        first (list[torch.tensor]): the cores of the first operand.
+        second (list[torch.tensor]): the cores of the second operand.
+
+    Returns:
+        list[torch.tensor]: the resulting cores.
+    """
+    d = len(first)
+    if d > 3:
+        s1, s2 = first[1].shape, second[1].shape
+        if s1.numel() <= _SMALL_CORE_NUMEL and s2.numel() <= _SMALL_CORE_NUMEL and \
+                all(c.shape == s1 for c in first[2:-1]) and all(c.shape == s2 for c in second[2:-1]):
+            interior = fn(tn.stack(first[1:-1]), tn.stack(second[1:-1]), 1, True)
+            return [fn(first[0], second[0], 0, False)] + list(interior.unbind(0)) + [fn(first[-1], second[-1], d-1, False)]
+
+    if first[0].is_cuda:
+        return _on_streams(lambda i: fn(first[i], second[i], i, False), d)
+
+    return [fn(c1, c2, i, False) for i, (c1, c2) in enumerate(zip(first, second))]
+
+
+def _on_streams(fn, n, num_streams=4):
+    """
+    Calls `fn(i)` for `i` in `range(n)` with the calls distributed round-robin on a pool of CUDA streams.
+    The kernels of the small cores are independent and can overlap on the GPU instead of being serialized by the launch latency.
+    The current stream waits for the pool before the results are returned.
+
+    Args:
+        fn (Callable): the function returning a torch.tensor on the current CUDA device.
+        n (int): number of calls.
+        num_streams (int, optional): the size of the stream pool. Defaults to 4.
+
+    Returns:
+        list[torch.tensor]: the results.
+    """
+    main = tn.cuda.current_stream()
+    streams = [tn.cuda.Stream() for _ in range(min(n, num_streams))]
+    for s in streams:
+        s.wait_stream(main)
+
+    results = []
+    for i in range(n):
+        with tn.cuda.stream(streams[i % len(streams)]):
+            results.append(fn(i))
+
+    for s in streams:
+        main.wait_stream(s)
+    for r in results:
+        # the memory allocated on the pool is used on the current stream from now on
+        r.record_stream(main)
+
+    return results
+
+
+def _matmul_cores(first, second, batched=False):
+    """
+    Builds the core of the product of two TT-matrices.
+    The contraction over the common mode is performed as a single GEMM of the flattened cores.
+
+    Args:
+        first (torch.tensor): the core of the first operand with the shape r1 x M x K x r2.
+        second (torch.tensor): the core of the second operand with the shape q1 x K x N x q2.
+        batched (bool, optional): the cores are stacked along a leading batch dimension and the GEMMs are batched. Defaults to False.
+
+    Returns:
+        torch.tensor: the resulting core with the shape r1*q1 x M x N x r2*q2.
+    """
+    if not batched:
+        first, second = first[None, ...], second[None, ...]
+
+    b, r1, m, k, r2 = first.shape
+    _, q1, _, n, q2 = second.shape
+
+    core = tn.reshape(tn.permute(first, [0, 1, 2, 4, 3]), [b, -1, k]) @ tn.reshape(
+        tn.permute(second, [0, 2, 1, 3, 4]), [b, k, -1])
+    core = tn.permute(tn.reshape(core, [b, r1, m, r2, q1, n, q2]), [
+                      0, 1, 4, 2, 5, 3, 6])
+    core = tn.reshape(core, [b, r1*q1, m, n, r2*q2])
+
+    return core if batched else core[0]
+
+
+def _coalesced_move(cores, move, pin=False):
+    """
+    Applies a transfer between the host and a device to all the cores at once.
+    The cores are flattened in one buffer (pinned if requested), the buffer is moved with a single copy and the new cores are views of the moved buffer.
+    Falls back to moving the cores one by one if they have different dtypes or require gradient.
+
+    Args:
+        cores (list[torch.tensor]): the cores (on the same device).
+        move (Callable): the transfer applied to a tensor (e.g. `lambda t: t.cuda(non_blocking=True)`).
+        pin (bool, optional): allocate the buffer in pinned memory (only for cores on the CPU). Defaults to False.
+
+    Returns:
+        list[torch.tensor]: the moved cores.
+    """
+    if len(cores) < 2 or any(c.requires_grad for c in cores) or any(c.dtype != cores[0].dtype for c in cores[1:]):
+        return [move(c) for c in cores]
+
+    numels = [c.numel() for c in cores]
+    flat = tn.empty(sum(numels), dtype=cores[0].dtype,
+                    device=cores[0].device, pin_memory=pin)
+    tn.cat([c.reshape(-1) for c in cores], out=flat)
+    flat = move(flat)
+
+    return [f.view(c.shape) for f, c in zip(tn.split(flat, numels), cores)]
+
+
+def _add_ranks(R1, R2):
+    """
+    Computes the ranks of the sum of two TT objects (the boundary ranks stay 1).
+
+    Args:
+        R1 (list[int]): the ranks of the first operand.
+        R2 (list[int]): the ranks of the second operand.
+
+    Returns:
+        list[int]: the ranks of the sum.
+    """
+    if len(R1) == 2:
+        return [1, 1]
+    return [1] + [r1 + r2 for r1, r2 in zip(R1[1:-1], R2[1:-1])] + [1]
+
+
+def _validate_cores(shapes):
+    """
+    Checks the shapes of the TT cores and extracts the ranks and the mode sizes in one pass.
+    Only the shapes are needed (no tensor is accessed).
+
+    Args:
+        shapes (list[torch.Size]): the shapes of the cores.
+
+    Raises:
+        RankMismatch: Ranks of the given cores do not match.
+        InvalidArguments: Invalid input: TT-cores have to be either 4d or 3d.
+        InvalidArguments: Check the ranks and the mode size.
+
+    Returns:
+        tuple[list[int], list[int], list[int], bool]: the rank, the column shape, the row shape (empty for TT tensors) and the TT-matrix flag.
+    """
+    d = len(shapes)
+    ndim = len(shapes[0])
+    if ndim != 3 and ndim != 4:
+        raise InvalidArguments(
+            "Invalid input: TT-cores have to be either 4d or 3d.")
+
+    R = [shapes[0][0]]
+    N = []
+    M = []
+    for i, s in enumerate(shapes):
+        if s[0] != R[-1]:
+            raise RankMismatch(
+                "Ranks of the given cores do not match: for core number %d previous rank is %d and and current rank is %d." % (i, R[-1], s[0]))
+        if len(s) != ndim:
+            if len(s) == 3 or len(s) == 4:
+                raise InvalidArguments("Check the ranks and the mode size.")
+            raise InvalidArguments(
+                "Invalid input: TT-cores have to be either 4d or 3d.")
+        R.append(s[-1])
+        N.append(s[-2])
+        if ndim == 4:
+            M.append(s[1])
+
+    if R[0] != 1 or R[-1] != 1:
+        raise InvalidArguments("Check the ranks and the mode size.")
+
+    return R, N, M, ndim == 4
+
 
 class TT():
 
     # cores : list[tn.tensor]
     # """ The TT cores as a list of `torch.tensor` instances."""
 
+    # orthogonality of the cores set by round(): the direction and the cores (with their versions) it was computed for
+    __orthogonal = None
+
     @property
     def is_ttm(self):
         """
@@ -124,39 +372,14 @@ class TT():
             # tt cores were passed directly
 
             # check if sizes are consistent
-            prev = 1
-            N = []
-            M = []
-            R = [source[0].shape[0]]
-            d = len(source)
-            for i in range(len(source)):
-                s = source[i].shape
-
-                if s[0] != R[-1]:
-                    raise RankMismatch(
-                        "Ranks of the given cores do not match: for core number %d previous rank is %d and and current rank is %d." % (i, R[-1], s[0]))
-                if len(s) == 3:
-                    R.append(s[2])
-                    N.append(s[1])
-                elif len(s) == 4:
-                    R.append(s[3])
-                    M.append(s[1])
-                    N.append(s[2])
-                else:
-                    raise InvalidArguments(
-                        "Invalid input: TT-cores have to be either 4d or 3d.")
-
-            if len(N) != d or len(R) != d+1 or R[0] != 1 or R[-1] != 1 or (len(M) != 0 and len(M) != len(N)):
-                raise InvalidArguments("Check the ranks and the mode size.")
+            R, N, M, is_ttm = _validate_cores([c.shape for c in source])
 
             self.cores = source
             self.__R = R
             self.__N = N
-            if len(M) == len(N):
+            self.__is_ttm = is_ttm
+            if is_ttm:
                 self.__M = M
-                self.__is_ttm = True
-            else:
-                self.__is_ttm = False
             self.shape = [(m, n) for m, n in zip(self.__M, self.__N)
                           ] if self.__is_ttm else [n for n in self.N]
 
@@ -228,6 +451,32 @@ class TT():
             raise NotImplementedError(
                 "Function only implemented for torch tensors, numpy arrays, list of cores as torch tensors and None.")
 
+    @classmethod
+    def _from_cores(cls, cores, N, R, M=None):
+        """
+        Creates a TT object from cores whose shapes are already known (e.g. the result of an arithmetic operation).
+        The validation of the cores done by the constructor is skipped.
+
+        Args:
+            cores (list[torch.tensor]): the TT-cores.
+            N (list[int]): the mode sizes (the column sizes for a TT-matrix). The list is not copied.
+            R (list[int]): the ranks. The list is not copied.
+            M (list[int], optional): the row sizes if the cores are TT-matrix cores. Defaults to None.
+
+        Returns:
+            torchtt.TT: the TT object.
+        """
+        obj = cls.__new__(cls)
+        obj.cores = cores
+        obj.__N = N
+        obj.__R = R
+        obj.__is_ttm = M is not None
+        if obj.__is_ttm:
+            obj.__M = M
+        obj.shape = [(m, n) for m, n in zip(M, N)] if obj.__is_ttm else list(N)
+
+        return obj
+
     def cuda(self, device=None):
         """
         Return a torchtt.TT object on the CUDA device by cloning all the cores on the GPU.
@@ -239,7 +488,12 @@ class TT():
             torchtt.TT: The TT-object. The TT-cores are on CUDA.
         """
 
-        t = TT([c.cuda(device) for c in self.cores])
+        if self.is_cuda():
+            return TT([c.cuda(device) for c in self.cores])
+
+        # one host to device copy from pinned memory instead of one copy per core
+        t = TT(_coalesced_move(self.cores, lambda c: c.cuda(
+            device, non_blocking=True), pin=True))
 
         return t
 
@@ -251,7 +505,10 @@ class TT():
             torchtt.TT: The TT-object on CPU.
         """
 
-        return TT([c.cpu() for c in self.cores])
+        if not self.is_cuda():
+            return TT([c.cpu() for c in self.cores])
+
+        return TT(_coalesced_move(self.cores, lambda c: c.cpu()))
 
     def is_cuda(self):
         """
@@ -260,7 +517,8 @@ class TT():
         Returns:
             bool: Is the torchtt.TT on GPU or not.
         """
-        return all([c.is_cuda for c in self.core])
+        # all the cores are on the same device (see cuda(), cpu() and to())
+        return len(self.cores) > 0 and self.cores[0].is_cuda
 
     def to(self, device=None, dtype=None):
         """
@@ -269,8 +527,35 @@ class TT():
         Args:
             device (torch.device, optional): The desired device. If none is provided, the device is the CPU. Defaults to None.
             dtype (torch.dtype, optional): The desired dtype (torch.float64, torch.float32,...). If None is provided the dtype is not changed. Defaults to None.
+
+        Returns:
+            torchtt.TT: the TT-object with the cores on the given device and with the given dtype.
+
+        Note:
+            For large ranks, the products with TT-matrices are bandwidth bound. Using `dtype=torch.bfloat16` halves the memory traffic and runs on tensor cores of recent GPUs at the cost of precision (about 3 significant digits).
+        """
+        if device is None or len(self.cores) == 0 or tn.device(device).type == self.cores[0].device.type:
+            return TT([c.to(device=device, dtype=dtype) for c in self.cores])
+
+        # transfer between the host and a device: a single copy (pinned and asynchronous for host to device)
+        pin = not self.is_cuda() and tn.device(device).type == 'cuda'
+        return TT(_coalesced_move(self.cores, lambda c: c.to(device=device, dtype=dtype, non_blocking=pin), pin=pin))
+
+    def tf32(self):
+        """
+        Casts the cores to `torch.float32` and allows `torch` to use TF32 tensor cores for the CUDA matrix multiplications (and convolutions).
+        TF32 keeps the range of FP32 but only 10 bits of mantissa, which is sufficient for many compression tasks and gives a higher GEMM throughput on Ampere and newer GPUs.
+
+        Note:
+            The TF32 flags (`torch.backends.cuda.matmul.allow_tf32` and `torch.backends.cudnn.allow_tf32`) are global and affect all the following `torch` computations.
+
+        Returns:
+            torchtt.TT: the TT-object with `torch.float32` cores.
         """
-        return TT([c.to(device=device, dtype=dtype) for c in self.cores])
+        tn.backends.cuda.matmul.allow_tf32 = True
+        tn.backends.cudnn.allow_tf32 = True
+
+        return self.to(device=self.cores[0].device, dtype=tn.float32)
 
     def detach(self):
         """
@@ -279,7 +564,7 @@ class TT():
         Returns:
             torchtt.TT: the detached tensor.
         """
-        return TT([c.detach() for c in self.cores])
+        return TT._from_cores([c.detach() for c in self.cores], self.N, self.R, self.M if self.__is_ttm else None)
 
     def clone(self):
         """
@@ -288,7 +573,7 @@ class TT():
         Returns:
             torchtt.TT: the cloned TT object.
         """
-        return TT([c.clone() for c in self.cores])
+        return TT._from_cores([c.clone() for c in self.cores], self.N, self.R, self.M if self.__is_ttm else None)
 
     def set_core(self, k, core):
         """
@@ -329,40 +614,39 @@ class TT():
         Returns:
             torch.tensor: the full tensor.
         """
+        d = len(self.__N)
+        R = self.__R
+        if d == 2 and not self.__is_ttm:
+            # a single product of the two cores
+            return self.cores[0][0] @ self.cores[1][..., 0]
+
+        # contract the cores from left to right as a sequence of GEMMs: (N1...Ni-1 x Ri) @ (Ri x Ni*Ri+1)
+        # in case of a TT-matrix the row and column modes are contracted as one leg
+        tfull = tn.reshape(self.cores[0], [-1, R[1]])
+        for i in range(1, d):
+            tfull = tn.reshape(
+                tfull @ tn.reshape(self.cores[i], [R[i], -1]), [-1, R[i+1]])
+
         if self.__is_ttm:
-            # the case of tt-matrix
-            tfull = self.cores[0][0, :, :, :]
-            for i in range(1, len(self.cores)-1):
-                tfull = tn.einsum('...i,ijkl->...jkl', tfull, self.cores[i])
-            if len(self.__N) != 1:
-                tfull = tn.einsum('...i,ijk->...jk', tfull,
-                                  self.cores[-1][:, :, :, 0])
-                tfull = tn.permute(tfull, list(
-                    np.arange(len(self.__N))*2)+list(np.arange(len(self.N))*2+1))
-            else:
-                tfull = tfull[:, :, 0]
+            # the case of tt-matrix: the modes are M1 x N1 x ... x Md x Nd and must be permuted once
+            tfull = tn.reshape(tfull, [s for mn in zip(self.__M, self.__N) for s in mn])
+            tfull = tn.permute(tfull, list(range(0, 2*d, 2))+list(range(1, 2*d, 2)))
         else:
             # the case of a normal tt
-            tfull = self.cores[0][0, :, :]
-            for i in range(1, len(self.cores)-1):
-                tfull = tn.einsum('...i,ijk->...jk', tfull, self.cores[i])
-            if len(self.__N) != 1:
-                tfull = tn.einsum('...i,ij->...j', tfull,
-                                  self.cores[-1][:, :, 0])
-            else:
-                tfull = tn.squeeze(tfull)
+            tfull = tn.reshape(tfull, self.__N)
         return tfull
 
     def numpy(self):
         """
         Return the full tensor as a numpy.array.
         In case of a TTM, the result has the shape ``M1 x M2 x ... x Md x N1 x N2 x ... x Nd``.
-        If it is involved in an AD graph, an error will occur.
+        If it is involved in an AD graph, the result is detached from it.
 
         Returns:
             numpy.array: the full tensor in numpy.
         """
-        return self.full().cpu().numpy()
+        tfull = self.full().detach()
+        return tfull.cpu().numpy() if tfull.is_cuda else tfull.numpy()
 
     def __repr__(self):
         """
@@ -380,9 +664,9 @@ class TT():
             output += 'Device: ' + \
                 str(self.cores[0].device)+', dtype: ' + \
                 str(self.cores[0].dtype)+'\n'
-            entries = sum([tn.numel(c) for c in self.cores])
-            output += '#entries ' + str(entries) + ' compression ' + str(entries/np.prod(
-                np.array(self.__N, dtype=np.float64)*np.array(self.__M, dtype=np.float64))) + '\n'
+            entries = sum(c.numel() for c in self.cores)
+            output += '#entries ' + str(entries) + ' compression ' + str(
+                entries/math.prod(m*n for m, n in zip(self.__M, self.__N))) + '\n'
         else:
             output = 'TT'
             output += ' with sizes and ranks:\n'
@@ -391,9 +675,9 @@ class TT():
             output += 'Device: ' + \
                 str(self.cores[0].device)+', dtype: ' + \
                 str(self.cores[0].dtype)+'\n'
-            entries = sum([tn.numel(c) for c in self.cores])
+            entries = sum(c.numel() for c in self.cores)
             output += '#entries ' + str(entries) + ' compression ' + str(
-                entries/np.prod(np.array(self.__N, dtype=np.float64))) + '\n'
+                entries/math.prod(self.__N)) + '\n'
 
         return output
 
@@ -429,94 +713,64 @@ class TT():
             torchtt.TT: the result.
         """
 
+        d = len(self.__N)
+
         if np.isscalar(other) or (tn.is_tensor(other) and tn.numel(other) == 1):
             # the second term is a scalar
             cores = []
 
-            for i in range(len(self.__N)):
-                if self.__is_ttm:
-                    pad1 = (0, 0 if i == len(self.__N)-1 else 1,
-                            0, 0, 0, 0, 0, 0 if i == 0 else 1)
-                    pad2 = (0 if i == len(
-                        self.__N)-1 else self.__R[i+1], 0, 0, 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                    othr = tn.ones(
-                        [1, 1, 1, 1], dtype=self.cores[i].dtype) * (other if i == 0 else 1)
-                else:
-                    pad1 = (0, 0 if i == len(self.__N)-1 else 1,
-                            0, 0, 0, 0 if i == 0 else 1)
-                    pad2 = (0 if i == len(
-                        self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                    othr = tn.ones(
-                        [1, 1, 1], dtype=self.cores[i].dtype) * (other if i == 0 else 1)
-
-                cores.append(tnf.pad(self.cores[i], pad1)+tnf.pad(othr, pad2))
+            # the scalar is a rank 1 TT with constant cores and is written directly in the new cores
+            othr = other.reshape([]) if tn.is_tensor(other) else other
+            for i in range(d):
+                cores.append(_add_cores(
+                    self.cores[i], othr if i == 0 else 1, i == 0, i == d-1))
 
-            result = TT(cores)
+            result = TT._from_cores(cores, self.N, _add_ranks(
+                self.__R, [1]*(d+1)), self.M if self.__is_ttm else None)
         elif isinstance(other, TT):
             # second term is TT object
             if self.__is_ttm and other.is_ttm:
                 # both are TT-matrices
-                if self.__M != self.M or self.__N != self.N:
+                if self.__M != other.M or self.__N != other.N:
                     raise ShapeMismatch("Shapes are incompatible: first operand is %s x %s, second operand is %s x %s." % (
                         str(self.M), str(self.N), str(other.M), str(other.N)))
 
-                cores = []
-                for i in range(len(self.__N)):
-                    pad1 = (0, 0 if i == len(
-                        self.__N)-1 else other.R[i+1], 0, 0, 0, 0, 0, 0 if i == 0 else other.R[i])
-                    pad2 = (0 if i == len(
-                        self.__N)-1 else self.__R[i+1], 0, 0, 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                    cores.append(
-                        tnf.pad(self.cores[i], pad1)+tnf.pad(other.cores[i], pad2))
+                cores = _corewise(lambda c1, c2, i, batched: _add_cores(
+                    c1, c2, i == 0, i == d-1, batched), self.cores, other.cores)
 
-                result = TT(cores)
+                result = TT._from_cores(cores, self.N, _add_ranks(
+                    self.__R, other.R), self.M)
 
             elif self.__is_ttm == False and other.is_ttm == False:
                 # normal tensors in TT format.
                 if self.__N == other.N:
-                    cores = []
-                    for i in range(len(self.__N)):
-                        pad1 = (0, 0 if i == len(
-                            self.__N)-1 else other.R[i+1], 0, 0, 0, 0 if i == 0 else other.R[i])
-                        pad2 = (0 if i == len(
-                            self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                        cores.append(
-                            tnf.pad(self.cores[i], pad1)+tnf.pad(other.cores[i], pad2))
+                    cores = _corewise(lambda c1, c2, i, batched: _add_cores(
+                        c1, c2, i == 0, i == d-1, batched), self.cores, other.cores)
+
+                    result = TT._from_cores(cores, self.N, _add_ranks(
+                        self.__R, other.R))
                 else:
-                    if len(self.__N) < len(other.N):
+                    if d < len(other.N):
                         raise ShapeMismatch("Shapes are incompatible: first operand is %s, second operand is %s." % (
                             str(self.N), str(other.N)))
 
+                    N, oN = self.__N, other.N
                     cores = []
-                    for i in range(len(self.cores)-len(other.cores)):
-                        pad1 = (0, 0 if i == len(self.__N)-1 else 1,
-                                0, 0, 0, 0 if i == 0 else 1)
-                        pad2 = (0 if i == len(
-                            self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                        cores.append(tnf.pad(self.cores[i], pad1)+tnf.pad(
-                            tn.ones((1, self.__N[i], 1), device=self.cores[i].device), pad2))
-
-                    for k, i in zip(range(len(other.cores)), range(len(self.cores)-len(other.cores), len(self.cores))):
-                        if other.N[k] == self.__N[i]:
-                            pad1 = (0, 0 if i == len(
-                                self.__N)-1 else other.R[k+1], 0, 0, 0, 0 if i == 0 else other.R[k])
-                            pad2 = (0 if i == len(
-                                self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                            cores.append(
-                                tnf.pad(self.cores[i], pad1)+tnf.pad(other.cores[k], pad2))
-
-                        elif other.N[k] == 1:
-                            pad1 = (0, 0 if i == len(
-                                self.__N)-1 else other.R[k+1], 0, 0, 0, 0 if i == 0 else other.R[k])
-                            pad2 = (0 if i == len(
-                                self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                            cores.append(tnf.pad(
-                                self.cores[i], pad1)+tnf.pad(tn.tile(other.cores[k], (1, self.__N[i], 1)), pad2))
+                    for i in range(d-len(oN)):
+                        cores.append(_add_cores(
+                            self.cores[i], 1, i == 0, i == d-1))
+
+                    for k, i in zip(range(len(oN)), range(d-len(oN), d)):
+                        if oN[k] == N[i] or oN[k] == 1:
+                            # a mode of size 1 is broadcasted by the slice assignment
+                            cores.append(_add_cores(
+                                self.cores[i], other.cores[k], i == 0, i == d-1))
                         else:
                             raise ShapeMismatch("Shapes are incompatible: first operand is %s, second operand is %s." % (
                                 str(self.N), str(other.N)))
 
-                result = TT(cores)
+                    result = TT._from_cores(
+                        cores, self.N, [c.shape[0] for c in cores] + [1])
 
             else:
                 # incompatible types
@@ -560,93 +814,65 @@ class TT():
         Returns:
             torchtt.TT: the result.
         """
-        if np.isscalar(other) or (tn.is_tensor(other) and other.shape == []):
+
+        d = len(self.__N)
+        if np.isscalar(other) or (tn.is_tensor(other) and tn.numel(other) == 1):
             # the second term is a scalar
             cores = []
 
-            for i in range(len(self.__N)):
-                if self.__is_ttm:
-                    pad1 = (0, 0 if i == len(self.__N)-1 else 1,
-                            0, 0, 0, 0, 0, 0 if i == 0 else 1)
-                    pad2 = (0 if i == len(
-                        self.__N)-1 else self.__R[i+1], 0, 0, 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                    othr = tn.ones(
-                        [1, 1, 1, 1], dtype=self.cores[i].dtype) * (-other if i == 0 else 1)
-                else:
-                    pad1 = (0, 0 if i == len(self.__N)-1 else 1,
-                            0, 0, 0, 0 if i == 0 else 1)
-                    pad2 = (0 if i == len(
-                        self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                    othr = tn.ones(
-                        [1, 1, 1], dtype=self.cores[i].dtype) * (-other if i == 0 else 1)
-                cores.append(tnf.pad(self.cores[i], pad1)+tnf.pad(othr, pad2))
-            result = TT(cores)
+            # the scalar is a rank 1 TT with constant cores and is written directly in the new cores
+            othr = other.reshape([]) if tn.is_tensor(other) else other
+            for i in range(d):
+                cores.append(_add_cores(
+                    self.cores[i], -othr if i == 0 else 1, i == 0, i == d-1))
+
+            result = TT._from_cores(cores, self.N, _add_ranks(
+                self.__R, [1]*(d+1)), self.M if self.__is_ttm else None)
 
         elif isinstance(other, TT):
             # second term is TT object
             if self.__is_ttm and other.is_ttm:
                 # both are TT-matrices
-                if self.__M != self.M or self.__N != self.N:
+                if self.__M != other.M or self.__N != other.N:
                     raise ShapeMismatch("Shapes are incompatible: first operand is %s x %s, second operand is %s x %s." % (
                         str(self.M), str(self.N), str(other.M), str(other.N)))
 
-                cores = []
-                for i in range(len(self.__N)):
-                    pad1 = (0, 0 if i == len(
-                        self.__N)-1 else other.R[i+1], 0, 0, 0, 0, 0, 0 if i == 0 else other.R[i])
-                    pad2 = (0 if i == len(
-                        self.__N)-1 else self.__R[i+1], 0, 0, 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                    cores.append(tnf.pad(
-                        self.cores[i], pad1)+tnf.pad(-other.cores[i] if i == 0 else other.cores[i], pad2))
+                cores = _corewise(lambda c1, c2, i, batched: _add_cores(
+                    c1, c2, i == 0, i == d-1, batched), self.cores, [-other.cores[0]] + other.cores[1:])
 
-                result = TT(cores)
+                result = TT._from_cores(cores, self.N, _add_ranks(
+                    self.__R, other.R), self.M)
 
             elif self.__is_ttm == False and other.is_ttm == False:
                 # normal tensors in TT format.
                 if self.__N == other.N:
-                    cores = []
-                    for i in range(len(self.__N)):
-                        pad1 = (0, 0 if i == len(
-                            self.__N)-1 else other.R[i+1], 0, 0, 0, 0 if i == 0 else other.R[i])
-                        pad2 = (0 if i == len(
-                            self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                        cores.append(tnf.pad(
-                            self.cores[i], pad1)+tnf.pad(-other.cores[i] if i == 0 else other.cores[i], pad2))
+                    cores = _corewise(lambda c1, c2, i, batched: _add_cores(
+                        c1, c2, i == 0, i == d-1, batched), self.cores, [-other.cores[0]] + other.cores[1:])
+
+                    result = TT._from_cores(cores, self.N, _add_ranks(
+                        self.__R, other.R))
                 else:
-                    if len(self.__N) < len(other.N):
+                    if d < len(other.N):
                         raise ShapeMismatch("Shapes are incompatible: first operand is %s, second operand is %s." % (
                             str(self.N), str(other.N)))
 
+                    N, oN = self.__N, other.N
                     cores = []
-                    for i in range(len(self.cores)-len(other.cores)):
-                        pad1 = (0, 0 if i == len(self.__N)-1 else 1,
-                                0, 0, 0, 0 if i == 0 else 1)
-                        pad2 = (0 if i == len(
-                            self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                        cores.append(tnf.pad(self.cores[i], pad1)+tnf.pad((-1 if i == 0 else 1)*tn.ones(
-                            (1, self.__N[i], 1), device=self.cores[i].device), pad2))
-
-                    for k, i in zip(range(len(other.cores)), range(len(self.cores)-len(other.cores), len(self.cores))):
-                        if other.N[k] == self.__N[i]:
-                            pad1 = (0, 0 if i == len(
-                                self.__N)-1 else other.R[k+1], 0, 0, 0, 0 if i == 0 else other.R[k])
-                            pad2 = (0 if i == len(
-                                self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                            cores.append(tnf.pad(
-                                self.cores[i], pad1)+tnf.pad(-other.cores[k] if i == 0 else other.cores[k], pad2))
-
-                        elif other.N[k] == 1:
-                            pad1 = (0, 0 if i == len(
-                                self.__N)-1 else other.R[k+1], 0, 0, 0, 0 if i == 0 else other.R[k])
-                            pad2 = (0 if i == len(
-                                self.__N)-1 else self.__R[i+1], 0, 0, 0, 0 if i == 0 else self.R[i], 0)
-                            cores.append(tnf.pad(self.cores[i], pad1)+tnf.pad(
-                                tn.tile(-other.cores[k] if i == 0 else other.cores[k], (1, self.__N[i], 1)), pad2))
+                    for i in range(d-len(oN)):
+                        cores.append(_add_cores(
+                            self.cores[i], -1 if i == 0 else 1, i == 0, i == d-1))
+
+                    for k, i in zip(range(len(oN)), range(d-len(oN), d)):
+                        if oN[k] == N[i] or oN[k] == 1:
+                            # a mode of size 1 is broadcasted by the slice assignment
+                            cores.append(_add_cores(
+                                self.cores[i], -other.cores[k] if i == 0 else other.cores[k], i == 0, i == d-1))
                         else:
                             raise ShapeMismatch("Shapes are incompatible: first operand is %s, second operand is %s." % (
                                 str(self.N), str(other.N)))
 
-                result = TT(cores)
+                    result = TT._from_cores(
+                        cores, self.N, [c.shape[0] for c in cores] + [1])
 
             else:
                 # incompatible types
@@ -704,18 +930,18 @@ class TT():
             torchtt.TT: the result.
         """
 
+        d = len(self.__N)
+
         # elementwise multiplication
         if isinstance(other, TT):
             if self.__is_ttm and other.is_ttm:
                 if self.__N == other.N and self.__M == other.M:
                     # raise ShapeMismatch('Shapes must be equal.')
 
-                    cores_new = []
-
-                    for i in range(len(self.cores)):
-                        core = tn.reshape(tn.einsum('aijb,mijn->amijbn', self.cores[i], other.cores[i]), [
-                                          self.__R[i]*other.R[i], self.__M[i], self.__N[i], self.R[i+1]*other.R[i+1]])
-                        cores_new.append(core)
+                    cores_new = _corewise(lambda c1, c2, i, batched: _mul_cores(
+                        c1, c2, batched), self.cores, other.cores)
+                    result = TT._from_cores(cores_new, self.N, [
+                                            r1*r2 for r1, r2 in zip(self.__R, other.R)], self.M)
 
                 else:
                     raise ShapeMismatch("Shapes are incompatible: first operand is %s x %s, second operand is %s x %s." % (
@@ -729,47 +955,48 @@ class TT():
             elif self.__is_ttm == False and other.is_ttm == False:
                 # broadcasting rul;es have to be applied. Sperate if else to make the non-broadcasting case the fastest.
                 if self.__N == other.N:
-                    cores_new = []
-
-                    for i in range(len(self.cores)):
-                        core = tn.reshape(tn.einsum('aib,min->amibn', self.cores[i], other.cores[i]), [
-                                          self.__R[i]*other.R[i], self.__N[i], self.R[i+1]*other.R[i+1]])
-                        cores_new.append(core)
+                    cores_new = _corewise(lambda c1, c2, i, batched: _mul_cores(
+                        c1, c2, batched), self.cores, other.cores)
+                    result = TT._from_cores(cores_new, self.N, [
+                                            r1*r2 for r1, r2 in zip(self.__R, other.R)])
                 else:
-                    if len(self.__N) < len(other.N):
+                    if d < len(other.N):
                         raise ShapeMismatch("Shapes are incompatible: first operand is %s, second operand is %s." % (
                             str(self.N), str(other.N)))
 
+                    N, oN = self.__N, other.N
                     cores_new = []
-                    for i in range(len(self.cores)-len(other.cores)):
+                    for i in range(d-len(oN)):
                         cores_new.append(self.cores[i]*1)
 
-                    for k, i in zip(range(len(other.cores)), range(len(self.cores)-len(other.cores), len(self.cores))):
-                        if other.N[k] == self.__N[i]:
-                            core = tn.reshape(tn.einsum('aib,min->amibn', self.cores[i], other.cores[k]), [
-                                              self.__R[i]*other.R[k], self.__N[i], self.R[i+1]*other.R[k+1]])
-                        elif other.N[k] == 1:
-                            core = tn.reshape(tn.einsum('aib,mn->amibn', self.cores[i], other.cores[k][:, 0, :]), [
-                                              self.__R[i]*other.R[k], self.__N[i], self.R[i+1]*other.R[k+1]])
+                    for k, i in zip(range(len(oN)), range(d-len(oN), d)):
+                        if oN[k] == N[i] or oN[k] == 1:
+                            # a mode of size 1 is broadcasted by the multiplication
+                            core = _mul_cores(self.cores[i], other.cores[k])
                         else:
                             raise ShapeMismatch("Shapes are incompatible: first operand is %s, second operand is %s." % (
                                 str(self.N), str(other.N)))
 
                         cores_new.append(core)
 
+                    result = TT._from_cores(
+                        cores_new, self.N, [c.shape[0] for c in cores_new] + [1])
             else:
                 raise IncompatibleTypes(
                     'Second operand must be the same type as the fisrt (both should be either TT matrices or TT tensors).')
-            result = TT(cores_new)
 
         elif isinstance(other, int) or isinstance(other, float) or isinstance(other, tn.tensor):
             if other != 0:
-                cores_new = [c+0 for c in self.cores]
-                cores_new[0] *= other
-                result = TT(cores_new)
+                # only the first core is scaled, the rest are shared
+                cores_new = list(self.cores)
+                cores_new[0] = self.cores[0] * other
+                result = TT._from_cores(
+                    cores_new, self.N, self.R, self.M if self.__is_ttm else None)
             else:
-                result = TT([tn.zeros((1, self.M[i], self.N[i], 1) if self.is_ttm else (
-                    1, self.N[i], 1), device=self.cores[0].device, dtype=self.cores[0].dtype) for i in range(len(self.N))])
+                N = self.__N
+                M = self.__M if self.__is_ttm else N
+                result = TT._from_cores([tn.zeros((1, M[i], N[i], 1) if self.__is_ttm else (
+                    1, N[i], 1), device=self.cores[0].device, dtype=self.cores[0].dtype) for i in range(d)], self.N, [1]*(d+1), self.M if self.__is_ttm else None)
                 # result = zeros([(m,n) for m,n in zip(self.M,self.N)] if self.is_ttm else self.N, device=self.cores[0].device)
         else:
             raise InvalidArguments(
@@ -798,8 +1025,10 @@ class TT():
             torchtt.TT | torch.tensor: the result. Can be full tensor if the second operand is full tensor.
         """
 
+        d = len(self.__N)
+
         if self.__is_ttm and tn.is_tensor(other):
-            if self.__N != list(other.shape)[-len(self.N):]:
+            if self.__N != list(other.shape)[-len(self.__N):]:
                 raise ShapeMismatch("Shapes do not match.")
             result = dense_matvec(self.cores, other)
             return result
@@ -809,39 +1038,32 @@ class TT():
             if self.__N != other.N:
                 raise ShapeMismatch("Shapes do not match.")
 
-            cores_new = []
-
-            for i in range(len(self.cores)):
-                core = tn.reshape(tn.einsum('ijkl,mkp->imjlp', self.cores[i], other.cores[i]), [
-                                  self.cores[i].shape[0]*other.cores[i].shape[0], self.cores[i].shape[1], self.cores[i].shape[3]*other.cores[i].shape[2]])
-                cores_new.append(core)
+            cores_new = _corewise(lambda c1, c2, i, batched: _matmul_cores(
+                c1, c2.unsqueeze(-2), batched).squeeze(-2), self.cores, other.cores)
+            result = TT._from_cores(cores_new, self.M, [
+                                    r1*r2 for r1, r2 in zip(self.__R, other.R)])
 
         elif self.__is_ttm and other.is_ttm:
             # multiplication between 2 TT-matrices
             if self.__N != other.M:
                 raise ShapeMismatch("Shapes do not match.")
 
-            cores_new = []
-
-            for i in range(len(self.cores)):
-                core = tn.reshape(tn.einsum('ijkl,mknp->imjnlp', self.cores[i], other.cores[i]), [
-                                  self.cores[i].shape[0]*other.cores[i].shape[0], self.cores[i].shape[1], other.cores[i].shape[2], self.cores[i].shape[3]*other.cores[i].shape[3]])
-                cores_new.append(core)
+            cores_new = _corewise(lambda c1, c2, i, batched: _matmul_cores(
+                c1, c2, batched), self.cores, other.cores)
+            result = TT._from_cores(cores_new, other.N, [
+                                    r1*r2 for r1, r2 in zip(self.__R, other.R)], self.M)
         elif self.__is_ttm == False and other.is_ttm:
             # vector-matrix multiplication
             if self.__N != other.M:
                 raise ShapeMismatch("Shapes do not match.")
 
-            cores_new = []
-
-            for i in range(len(self.cores)):
-                core = tn.reshape(tn.einsum('mkp,ikjl->imjlp', self.cores[i], other.cores[i]), [
-                                  self.cores[i].shape[0]*other.cores[i].shape[0], other.cores[i].shape[2], self.cores[i].shape[2]*other.cores[i].shape[3]])
-                cores_new.append(core)
+            cores_new = _corewise(lambda c1, c2, i, batched: _matmul_cores(
+                c1.unsqueeze(-3), c2, batched).squeeze(-3), self.cores, other.cores)
+            result = TT._from_cores(cores_new, other.N, [
+                                    r1*r2 for r1, r2 in zip(self.__R, other.R)])
         else:
             raise InvalidArguments("Wrong arguments.")
 
-        result = TT(cores_new)
         return result
 
     def fast_matvec(self, other, eps=1e-12, initial=None, nswp=20, verb=False, use_cpp=True):
@@ -916,9 +1138,11 @@ class TT():
         """
         if isinstance(other, int) or isinstance(other, float) or tn.is_tensor(other):
             # divide by a scalar
-            cores_new = self.cores.copy()
-            cores_new[0] /= other
-            result = TT(cores_new)
+            # only the first core is scaled, the rest are shared
+            cores_new = list(self.cores)
+            cores_new[0] = self.cores[0] / other
+            result = TT._from_cores(
+                cores_new, self.N, self.R, self.M if self.__is_ttm else None)
         elif isinstance(other, TT):
             if self.__is_ttm != other.is_ttm:
                 raise IncompatibleTypes('Operands should be either TT or TTM.')
@@ -972,6 +1196,7 @@ class TT():
     def t(self):
         """
         Returns the transpose of a given TT matrix.
+        The cores of the result are views of the original cores (no copy is made).
 
 
         Returns:
@@ -985,7 +1210,7 @@ class TT():
 
         cores_new = [tn.permute(c, [0, 2, 1, 3]) for c in self.cores]
 
-        return TT(cores_new)
+        return TT._from_cores(cores_new, self.M, self.R, self.N)
 
     def norm(self, squared=False):
         """
@@ -1002,53 +1227,21 @@ class TT():
             norm = tn.tensor([[1.0]], dtype=self.cores[0].dtype,
                              device=self.cores[0].device)
 
-            if self.__is_ttm:
-                for i in range(len(self.__N)):
-                    norm = tn.einsum('ab,aijm,bijn->mn', norm,
-                                     self.cores[i], tn.conj(self.cores[i]))
-                norm = tn.squeeze(norm)
-            else:
-
-                for i in range(len(self.__N)):
-                    norm = tn.einsum('ab,aim,bin->mn', norm,
-                                     self.cores[i], tn.conj(self.cores[i]))
-                norm = tn.squeeze(norm)
+            # contract norm_ab C_akm conj(C)_bkn -> mn with two GEMMs (the modes of a TT-matrix core are merged in k)
+            for c in self.cores:
+                r1, r2 = c.shape[0], c.shape[-1]
+                tmp = tn.reshape(norm.T @ tn.reshape(c, [r1, -1]), [-1, r2])
+                norm = tmp.T @ tn.reshape(tn.conj(c), [-1, r2])
+            norm = tn.squeeze(norm)
             if squared:
                 return norm
             else:
-                return tn.sqrt(tn.abs(norm))
+                # the squared norm is real up to rounding: drop the imaginary part and clamp instead of abs()
+                return tn.real(norm).clamp_min(0).sqrt()
 
         else:
-            d = len(self.cores)
-
-            core_now = self.cores[0]
-            for i in range(d-1):
-                if self.__is_ttm:
-                    mode_shape = [core_now.shape[1], core_now.shape[2]]
-                    core_now = tn.reshape(
-                        core_now, [core_now.shape[0]*core_now.shape[1]*core_now.shape[2], -1])
-                else:
-                    mode_shape = [core_now.shape[1]]
-                    core_now = tn.reshape(
-                        core_now, [core_now.shape[0]*core_now.shape[1], -1])
-
-                # perform QR
-                Qmat, Rmat = QR(core_now)
-
-                # take next core
-                core_next = self.cores[i+1]
-                shape_next = list(core_next.shape[1:])
-                core_next = tn.reshape(core_next, [core_next.shape[0], -1])
-                core_next = Rmat @ core_next
-                core_next = tn.reshape(core_next, [Qmat.shape[1]]+shape_next)
-
-                # update the cores
-
-                core_now = core_next
-            if squared:
-                return tn.linalg.norm(core_next)**2
-            else:
-                return tn.linalg.norm(core_next)
+            norm = norm_cores(self.cores)
+            return norm**2 if squared else norm
 
     def sum(self, index=None):
         """
@@ -1081,18 +1274,12 @@ class TT():
             raise InvalidArguments('Invalid index.')
 
         if index == None:
-            # the case we need to sum over all modes
-            if self.__is_ttm:
-                C = tn.reduce_sum(self.cores[0], [0, 1, 2])
-                for i in range(1, len(self.__N)):
-                    C = tn.sum(tn.einsum('i,ijkl->jkl',
-                               C, self.cores[i]), [0, 1])
-                S = tn.sum(C)
-            else:
-                C = tn.sum(self.cores[0], [0, 1])
-                for i in range(1, len(self.__N)):
-                    C = tn.sum(tn.einsum('i,ijk->jk', C, self.cores[i]), 0)
-                S = tn.sum(C)
+            # the case we need to sum over all modes: the modes of every core are summed first and the resulting rank matrices are multiplied (vector-matrix products)
+            modes = [1, 2] if self.__is_ttm else [1]
+            C = tn.sum(self.cores[0], [0] + modes)
+            for i in range(1, len(self.__N)):
+                C = C @ tn.sum(self.cores[i], modes)
+            S = C[0]
         else:
             # we return the TT-tensor with summed indices
             cores = []
@@ -1124,9 +1311,9 @@ class TT():
             torch.TT: the result
         """
 
-        cores_new = [tn.reshape(
-            c, (c.shape[0], c.shape[1], 1, c.shape[2])) for c in self.cores]
-        return TT(cores_new)
+        # adding the size 1 column mode is a view of every core
+        cores_new = [c.unsqueeze(2) for c in self.cores]
+        return TT._from_cores(cores_new, [1] * len(cores_new), self.__R.copy(), self.__N.copy())
 
     def reduce_dims(self, exclude=[]):
         """
@@ -1139,79 +1326,45 @@ class TT():
 
         # TODO: implement a version that reduces the rank also. by spliting the cores with modes 1 into 2 using the SVD.
 
-        if self.__is_ttm:
-            cores_new = []
-
-            for i in range(len(self.__N)):
-
-                if self.cores[i].shape[1] == 1 and self.cores[i].shape[2] == 1 and not i in exclude:
-                    if self.cores[i].shape[0] > self.cores[i].shape[3] or i == len(self.__N)-1:
-                        # multiply to the left
-                        if len(cores_new) > 0:
-                            cores_new[-1] = tn.einsum('ijok,kl->ijol',
-                                                      cores_new[-1], self.cores[i][:, 0, 0, :])
-                        else:
-                            # there is no core to the left. Multiply right.
-                            if i != len(self.__N)-1:
-                                self.cores[i+1] = tn.einsum(
-                                    'ij,jkml->ikml', self.cores[i][:, 0, 0, :], self.cores[i+1])
-                            else:
-                                cores_new.append(self.cores[i])
-
-                    else:
-                        # multiply to the right. Set the carry
-                        self.cores[i+1] = tn.einsum('ij,jkml->ikml',
-                                                    self.cores[i][:, 0, 0, :], self.cores[i+1])
-
-                else:
-                    cores_new.append(self.cores[i])
-
-            # update the cores and ranks and shape
-            self.__N = []
-            self.__M = []
-            self.__R = [1]
-            for i in range(len(cores_new)):
-                self.__N.append(cores_new[i].shape[2])
-                self.__M.append(cores_new[i].shape[1])
-                self.__R.append(cores_new[i].shape[3])
-            self.cores = cores_new
-        else:
-            cores_new = []
-
-            for i in range(len(self.__N)):
-
-                if self.cores[i].shape[1] == 1 and not i in exclude:
-                    if self.cores[i].shape[0] > self.cores[i].shape[2] or i == len(self.__N)-1:
-                        # multiply to the left
-                        if len(cores_new) > 0:
-                            cores_new[-1] = tn.einsum('ijk,kl->ijl',
-                                                      cores_new[-1], self.cores[i][:, 0, :])
-                        else:
-                            # there is no core to the left. Multiply right.
-                            if i != len(self.__N)-1:
-                                self.cores[i+1] = tn.einsum(
-                                    'ij,jkl->ikl', self.cores[i][:, 0, :], self.cores[i+1])
-                            else:
-                                cores_new.append(self.cores[i])
+        cores = list(self.cores)
+        cores_new = []
+        # the mode sizes of the kept cores are final when a core is kept (absorbing a matrix changes only the ranks)
+        N_new, M_new = [], []
+        d = len(cores)
 
+        def keep(core):
+            cores_new.append(core)
+            N_new.append(core.shape[-2])
+            if self.__is_ttm:
+                M_new.append(core.shape[1])
+
+        for i in range(d):
+            core = cores[i]
+            if all(s == 1 for s in core.shape[1:-1]) and not i in exclude:
+                # the core is a matrix: absorb it in a neighbour
+                slab = tn.reshape(core, [core.shape[0], core.shape[-1]])
+                if core.shape[0] > core.shape[-1] or i == d-1:
+                    # multiply to the left
+                    if len(cores_new) > 0:
+                        cores_new[-1] = absorb_right(cores_new[-1], slab)
+                    elif i != d-1:
+                        # there is no core to the left. Multiply right.
+                        cores[i+1] = absorb_left(slab, cores[i+1])
                     else:
-                        # multiply to the right. Set the carry
-                        self.cores[i+1] = tn.einsum('ij,jkl->ikl',
-                                                    self.cores[i][:, 0, :], self.cores[i+1])
-
+                        keep(core)
                 else:
-                    cores_new.append(self.cores[i])
-
-            # update the cores and ranks and shape
-            self.__N = []
-            self.__R = [1]
-            for i in range(len(cores_new)):
-                self.__N.append(cores_new[i].shape[1])
-                self.__R.append(cores_new[i].shape[2])
-            self.cores = cores_new
+                    # multiply to the right. Set the carry
+                    cores[i+1] = absorb_left(slab, cores[i+1])
+            else:
+                keep(core)
 
+        self.cores = cores_new
+        self.__N = N_new
+        self.__R = [1] + [c.shape[-1] for c in cores_new]
+        if self.__is_ttm:
+            self.__M = M_new
         self.shape = [(m, n) for m, n in zip(self.__M, self.__N)
-                      ] if self.__is_ttm else [n for n in self.N]
+                      ] if self.__is_ttm else list(self.__N)
 
     def __getitem__(self, index):
         """
@@ -1242,7 +1395,19 @@ class TT():
 
         exclude = []
 
-        if isinstance(index, tuple):
+        if isinstance(index, tuple) and len(index) == len(self.__N)*(2 if self.__is_ttm else 1) and all(isinstance(i, int) for i in index):
+            # a single entry: multiply the selected slices of the cores from left to right (vector-matrix products)
+            d = len(self.__N)
+            if self.__is_ttm:
+                slices = [c[:, index[i], index[i+d], :] for i, c in enumerate(self.cores)]
+            else:
+                slices = [c[:, index[i], :] for i, c in enumerate(self.cores)]
+            sliced = slices[0][0, :]
+            for v in slices[1:]:
+                sliced = sliced @ v
+            sliced = sliced[0]
+
+        elif isinstance(index, tuple):
             # check if more than two Ellipsis are to be found.
             if index.count(Ellipsis) > 1 or (self.is_ttm and index.count(Ellipsis) > 0):
                 raise NotImplementedError(
@@ -1265,8 +1430,7 @@ class TT():
                         cores_new.append(tmp)
                         exclude.append(i)
                     elif isinstance(idx1, int) and isinstance(idx2, int):
-                        cores_new.append(tn.reshape(self.cores[k][:, idx1, idx2, :], [
-                                         self.__R[k], 1, 1, self.R[k+1]]))
+                        cores_new.append(self.cores[k][:, idx1, idx2, :][:, None, None, :])
                         k += 1
                     else:
                         raise InvalidArguments(
@@ -1298,8 +1462,7 @@ class TT():
                         cores_new.append(tmp)
                         exclude.append(i)
                     elif isinstance(idx, int):
-                        cores_new.append(tn.reshape(self.cores[k][:, idx, :], [
-                                         self.__R[k], -1, self.R[k+1]]))
+                        cores_new.append(self.cores[k][:, idx, :][:, None, :])
                         k += 1
                     else:
                         raise InvalidArguments(
@@ -1307,7 +1470,12 @@ class TT():
                 if k < len(self.cores):
                     raise InvalidArguments('Slice size is invalid.')
 
-            sliced = TT(cores_new)
+            # the slices of valid cores are valid: the sizes are read from the cores without validation
+            R_new = [c.shape[0] for c in cores_new] + [1]
+            if self.__is_ttm:
+                sliced = TT._from_cores(cores_new, [c.shape[2] for c in cores_new], R_new, [c.shape[1] for c in cores_new])
+            else:
+                sliced = TT._from_cores(cores_new, [c.shape[1] for c in cores_new], R_new)
             sliced.reduce_dims(exclude)
             if (sliced.is_ttm == False and sliced.N == [1]) or (sliced.is_ttm and sliced.N == [1] and sliced.M == [1]):
                 sliced = tn.squeeze(sliced.cores[0])
@@ -1344,6 +1512,7 @@ class TT():
         This implements the "**" operator.
         If None is provided as input the reult is the other tensor.
         If A is N_1 x ... x N_d and B is M_1 x ... x M_p, then kron(A,B) is N_1 x ... x N_d x M_1 x ... x M_p
+        The cores of the result are shared with the operands (no copy is made).
 
 
         Args:
@@ -1359,17 +1528,17 @@ class TT():
         """
 
         if other == None:
-            cores_new = [c.clone() for c in self.cores]
-            result = TT(cores_new)
+            result = TT._from_cores(
+                list(self.cores), self.N, self.R, self.M if self.__is_ttm else None)
         elif isinstance(other, TT):
             if self.is_ttm != other.is_ttm:
                 raise IncompatibleTypes(
                     'Incompatible data types (make sure both are either TT-matrices or TT-tensors).')
 
             # concatenate the result
-            cores_new = [c.clone() for c in self.cores] + [c.clone()
-                                                           for c in other.cores]
-            result = TT(cores_new)
+            cores_new = self.cores + other.cores
+            result = TT._from_cores(cores_new, self.N + other.N, self.R[:-1] + other.R,
+                                    self.M + other.M if self.__is_ttm else None)
         else:
             raise InvalidArguments('Invalid arguments.')
 
@@ -1408,23 +1577,23 @@ class TT():
             torchtt.TT: the negated tensor.
         """
 
-        cores_new = [c.clone() for c in self.cores]
-        cores_new[0] = -cores_new[0]
-        return TT(cores_new)
+        # only the first core is negated, the rest are shared
+        cores_new = [-self.cores[0]] + self.cores[1:]
+        return TT._from_cores(cores_new, self.N, self.R, self.M if self.__is_ttm else None)
 
     def __pos__(self):
         """
-        Implements the unary "+" operator returning a copy o the tensor.
+        Implements the unary "+" operator returning a new TT object sharing the cores of the tensor.
 
         Returns:
-            torchtt.TT: the tensor clone.
+            torchtt.TT: the tensor.
         """
 
-        cores_new = [c.clone() for c in self.cores]
+        cores_new = list(self.cores)
 
-        return TT(cores_new)
+        return TT._from_cores(cores_new, self.N, self.R, self.M if self.__is_ttm else None)
 
-    def round(self, eps=1e-12, rmax=sys.maxsize):
+    def round(self, eps=1e-12, rmax=sys.maxsize, no_gpu=False):
         """
         Implements the rounding operations within a given tolerance epsilon.
         The maximum rank is also provided.
@@ -1432,6 +1601,7 @@ class TT():
         Args:
             eps (float, optional): the relative accuracy. Defaults to 1e-12.
             rmax (int, optional): the maximum rank. Defaults to the maximum possible integer.
+            no_gpu (bool, optional): perform the QR decompositions of the orthogonalization on the CPU. For many small cores on the GPU this avoids the slow CUDA QR. Defaults to False.
 
         Returns:
             torchtt.TT: the result.
@@ -1441,14 +1611,34 @@ class TT():
         if not isinstance(rmax, list):
             rmax = [1] + len(self.__N)*[rmax] + [1]
 
+        # the orthogonalization is skipped if the cores are known to be orthogonal (e.g. the result of a previous rounding)
+        orthogonal = self._orthogonality()
+
         # call the round function
         tt_cores, R = round_tt(
-            self.cores, self.__R.copy(), eps, rmax, self.__is_ttm)
+            self.cores, self.__R.copy(), eps, rmax, self.__is_ttm, no_gpu, orthogonal)
         # creates a new TT and return it
         T = TT(tt_cores)
+        if len(tt_cores) > 1:
+            T.__orthogonal = ('left' if orthogonal == 'right' else 'right', [(c, c._version) for c in tt_cores])
 
         return T
 
+    def _orthogonality(self):
+        """
+        Returns the orthogonality of the cores if it is known.
+        The information is discarded if the cores were replaced or modified in place since it was recorded.
+
+        Returns:
+            str | None: 'left' (the first d-1 cores are left orthogonal), 'right' (the last d-1 cores are right orthogonal) or None.
+        """
+        if self.__orthogonal is None:
+            return None
+        direction, cores = self.__orthogonal
+        if len(cores) == len(self.cores) and all(c is c_old and c._version == v for c, (c_old, v) in zip(self.cores, cores)):
+            return direction
+        return None
+
     def to_qtt(self, eps=1e-12, mode_size=2, rmax=sys.maxsize):
         """
         Converts a tensor to the QTT format: N1 x N2 x ... x Nd -> mode_size x mode_size x ... x mode_size.
@@ -1487,7 +1677,7 @@ class TT():
                 if self.__N[i] != self.__M[i]:
                     raise ShapeMismatch(
                         'Only quadratic TTM can be tranformed to QTT.')
-                if self.__N[i] == mode_size**int(math.log(self.N[i], mode_size)):
+                if self.__N[i] == mode_size**int(math.log(self.__N[i], mode_size)):
                     shape_new += [(mode_size, mode_size)] * \
                         int(math.log(self.__N[i], mode_size))
                 else:
@@ -1548,11 +1738,11 @@ class TT():
                     core = c
                     so_far = core.shape[1]
                 else:
-                    core = tn.einsum('...i,ijk->...jk', core, c)
+                    # core is kept as r_left x prod(modes) x r_right
+                    core = tn.reshape(tn.reshape(core, [-1, core.shape[-1]]) @ tn.reshape(
+                        c, [c.shape[0], -1]), [core.shape[0], -1, c.shape[-1]])
                     so_far *= c.shape[1]
                 if so_far == original_shape[k]:
-                    core = tn.reshape(
-                        core, [core.shape[0], -1, core.shape[-1]])
                     cores_new.append(core)
                     core = None
                     k += 1
@@ -1582,22 +1772,27 @@ class TT():
                 "n-model product works only with TT-tensors and not TT matrices.")
 
         if isinstance(factor_matrices, list) and isinstance(mode, list):
-            cores_new = [c.clone() for c in self.cores]
+            # the factors acting on the same mode are multiplied first (matrices are smaller than the cores)
+            factors = {}
             for i in range(len(factor_matrices)):
-                if cores_new[mode[i]].shape[1] != factor_matrices[i].shape[1]:
+                n = factors[mode[i]].shape[0] if mode[i] in factors else self.__N[mode[i]]
+                if n != factor_matrices[i].shape[1]:
                     raise ShapeMismatch(
                         "The n-th mode of the tensor must be equal with the 2nd mode of the matrix.")
-                # if self.__is_ttm else tn.einsum('ijk,lj->ilk',cores_new[mode[i]],factor_matrices[i])
-                cores_new[mode[i]] = tn.einsum(
-                    'ijk,lj->ilk', cores_new[mode[i]], factor_matrices[i])
+                if mode[i] in factors:
+                    factors[mode[i]] = factor_matrices[i] @ factors[mode[i]]
+                else:
+                    factors[mode[i]] = factor_matrices[i]
+            cores_new = list(self.cores)
+            for m, factor in factors.items():
+                # batched GEMM over the first rank: (n' x n) @ (n x r2)
+                cores_new[m] = factor @ cores_new[m]
         elif isinstance(mode, int) and tn.is_tensor(factor_matrices):
-            cores_new = [c.clone() for c in self.cores]
+            cores_new = list(self.cores)
             if cores_new[mode].shape[1] != factor_matrices.shape[1]:
                 raise ShapeMismatch(
                     "The n-th mode of the tensor must be equal with the 2nd mode of the matrix.")
-            # if self.__is_ttm else tn.einsum('ijk,lj->ilk',cores_new[mode],factor_matrices)
-            cores_new[mode] = tn.einsum(
-                'ijk,lj->ilk', cores_new[mode], factor_matrices)
+            cores_new[mode] = factor_matrices @ cores_new[mode]
         else:
             raise InvalidArguments('Invalid arguments.')
 
@@ -1610,4 +1805,4 @@ class TT():
         Returns:
             torchtt.TT: the complex conjugated tensor.
         """
-        return TT([tn.conj(c) for c in self.cores])
+        return TT._from_cores([tn.conj(c) for c in self.cores], self.N, self.R, self.M if self.__is_ttm else None)